@@ -10,13 +10,11 @@ to ensure that tuning settings survive a reboot.
 from __future__ import annotations
 
 import logging
-import tempfile
-import os
-import contextlib
-from dataclasses import dataclass
+import re
 from pathlib import Path
+from typing import NamedTuple
 
-from core.utils.common import run, SystemCommandError, read_file
+from core.utils.common import read_file, read_proc_small
 from core.utils.io import atomic_write_to_file, is_root
 from core.utils.bootloader import detect_bootloader
 from core.utils.kernel_cmdline import is_kernel_param_active
@@ -32,9 +30,12 @@ from core.utils.grub_paths import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# 'key = value' line of a sysctl.d file; a leading '-' marks a key whose
+# write failures are ignored (sysctl.d(5)) and is not part of the key name.
+_SYSCTL_LINE = re.compile(r"^\s*-?\s*([\w./-]+)\s*=\s*(.*?)\s*$")
 
-@dataclass(frozen=True)
-class TuneResult:
+
+class TuneResult(NamedTuple):
     """Represents the outcome of a persistent tuning operation."""
 
     success: bool
@@ -43,9 +44,32 @@ class TuneResult:
     action_needed: str | None = None
 
 
+class BootConfigSnapshot(NamedTuple):
+    """Bootloader and drop-in file contents, read once for several setters."""
+
+    bootloader: str
+    sysctl_content: str | None
+    grub_zswap_content: str | None
+    grub_psi_content: str | None
+
+
+def snapshot_boot_config() -> BootConfigSnapshot:
+    """
+    Probes the bootloader (a PATH scan) and reads the managed drop-ins in one
+    pass. Take it right before a group of setter calls; it is not refreshed
+    by their writes, so do not reuse it for a second write to the same file.
+    """
+    return BootConfigSnapshot(
+        bootloader=detect_bootloader(),
+        sysctl_content=read_file(SYSCTL_CONFIG_PATH),
+        grub_zswap_content=read_file(GRUB_ZSWAP_DISABLE_PATH),
+        grub_psi_content=read_file(GRUB_PSI_ENABLE_PATH),
+    )
+
+
 def get_swappiness() -> int | None:
     """Reads the current system swappiness value."""
-    if not (content := read_file("/proc/sys/vm/swappiness")):
+    if not (content := read_proc_small("/proc/sys/vm/swappiness")):
         return None
     try:
         return int(content.strip())
@@ -53,46 +77,112 @@ def get_swappiness() -> int | None:
         return None
 
 
+def _parse_sysctl(content: str) -> dict[str, str]:
+    """Parses sysctl.d style 'key = value' lines into a dict."""
+    parsed = {}
+    for line in content.splitlines():
+        if (m := _SYSCTL_LINE.match(line)) and not line.lstrip().startswith(("#", ";")):
+            parsed[m.group(1)] = m.group(2)
+    return parsed
+
+
+_DEFAULT_SYSCTL_DICT = _parse_sysctl(SYSCTL_DEFAULT_SETTINGS)
+_GAMING_SYSCTL_DICT = _parse_sysctl(SYSCTL_GAMING_PROFILE)
+
+# The profile as read_file() returns it when the drop-in is our own write;
+# matching it exactly skips the line-by-line parse on the common path.
+_GAMING_PROFILE_TEXT = SYSCTL_GAMING_PROFILE.strip()
+
+# Drop-in file bodies, newline-terminated and encoded once for pkexec_write.
+_GAMING_PROFILE_BYTES = (SYSCTL_GAMING_PROFILE + "\n").encode("utf-8")
+_DEFAULT_SYSCTL_BYTES = (SYSCTL_DEFAULT_SETTINGS + "\n").encode("utf-8")
+_GRUB_ZSWAP_BYTES = (GRUB_ZSWAP_DISABLE_CONTENT + "\n").encode("utf-8")
+_GRUB_PSI_BYTES = (GRUB_PSI_ENABLE_CONTENT + "\n").encode("utf-8")
+
+
+def _sysctl_proc_path(key: str) -> Path:
+    """Maps a sysctl key to its /proc/sys node ('.' and '/' swap, as in sysctl(8))."""
+    return Path("/proc/sys") / key.translate(str.maketrans("./", "/."))
+
+
+def _write_sysctl_live(settings: dict[str, str]) -> tuple[bool, str | None]:
+    """
+    Applies sysctl values by writing them straight to /proc/sys.
+    Falls back to loading our drop-in with 'sysctl -p' (a full reload via pkexec
+    when unprivileged) if any direct write fails.
+    """
+    for key, value in settings.items():
+        try:
+            _sysctl_proc_path(key).write_text(str(value), encoding="utf-8")
+        except OSError as e:
+            _LOGGER.debug("Direct write of %s failed (%s); loading drop-in.", key, e)
+            from core.utils.privilege import pkexec_sysctl_load
+
+            return pkexec_sysctl_load(str(SYSCTL_CONFIG_PATH))
+    return True, None
+
+
+def _sysctl_live_matches(settings: dict[str, str]) -> bool:
+    """Checks whether the running kernel already uses the given sysctl values."""
+    for key, value in settings.items():
+        live = read_file(_sysctl_proc_path(key))
+        if live is None or live.split() != str(value).split():
+            return False
+    return True
+
+
 def _revert_sysctl_to_defaults() -> bool:
-    """Writes the default sysctl settings to a temporary file and applies them."""
-    temp_f_name = None
+    """Writes the default sysctl settings straight to /proc/sys."""
     try:
-        with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_f:
-            temp_f_name = temp_f.name
-            temp_f.write(SYSCTL_DEFAULT_SETTINGS)
-            temp_f.flush()
-            run(["sysctl", "--load", temp_f_name], check=True)
+        for key, value in _DEFAULT_SYSCTL_DICT.items():
+            _sysctl_proc_path(key).write_text(value, encoding="utf-8")
         _LOGGER.info("Successfully reverted sysctl settings to defaults.")
         return True
-    except (SystemCommandError, OSError) as e:
+    except OSError as e:
         _LOGGER.error(f"Failed to revert sysctl settings to defaults: {e}")
         return False
-    finally:
-        if temp_f_name:
-            with contextlib.suppress(OSError):
-                os.unlink(temp_f_name)
 
 
-def apply_sysctl_profile(enable: bool) -> TuneResult:
+def apply_sysctl_profile(
+    enable: bool, snapshot: BootConfigSnapshot | None = None
+) -> TuneResult:
     """
     Idempotently enables or disables the optimal sysctl performance profile.
     """
     from core.utils.io import pkexec_write
-    from core.utils.privilege import pkexec_sysctl_system
 
     if enable:
-        current_content = read_file(SYSCTL_CONFIG_PATH)
-        if current_content and current_content.strip() == SYSCTL_GAMING_PROFILE:
-            _LOGGER.info("Sysctl profile file is already correctly configured.")
+        current_content = (
+            snapshot.sysctl_content if snapshot else read_file(SYSCTL_CONFIG_PATH)
+        )
+        if current_content and (
+            current_content == _GAMING_PROFILE_TEXT
+            or _parse_sysctl(current_content) == _GAMING_SYSCTL_DICT
+        ):
+            if _sysctl_live_matches(_GAMING_SYSCTL_DICT):
+                _LOGGER.info("Sysctl profile is already configured and live.")
+                return TuneResult(
+                    success=True,
+                    changed=False,
+                    message="Sysctl performance profile is already configured.",
+                )
+
+            ok, err = _write_sysctl_live(_GAMING_SYSCTL_DICT)
+            if not ok:
+                return TuneResult(
+                    success=False,
+                    changed=False,
+                    message=f"Config file is in place, but failed to apply live settings: {err}",
+                )
             return TuneResult(
                 success=True,
-                changed=False,
-                message="Sysctl performance profile is already configured.",
+                changed=True,
+                message="Sysctl performance profile was re-applied to the running kernel.",
             )
 
         _LOGGER.info("Writing sysctl performance profile configuration.")
         success, error = pkexec_write(
-            str(SYSCTL_CONFIG_PATH), SYSCTL_GAMING_PROFILE + "\n"
+            str(SYSCTL_CONFIG_PATH), _GAMING_PROFILE_BYTES
         )
         if not success:
             return TuneResult(
@@ -101,7 +191,7 @@ def apply_sysctl_profile(enable: bool) -> TuneResult:
                 message=f"Failed to write sysctl config: {error}",
             )
 
-        ok, err = pkexec_sysctl_system()
+        ok, err = _write_sysctl_live(_GAMING_SYSCTL_DICT)
         if not ok:
             _LOGGER.error(f"Failed to apply live sysctl settings: {err}")
             return TuneResult(
@@ -125,7 +215,7 @@ def apply_sysctl_profile(enable: bool) -> TuneResult:
             )
 
         success, error = pkexec_write(
-            str(SYSCTL_CONFIG_PATH), SYSCTL_DEFAULT_SETTINGS + "\n"
+            str(SYSCTL_CONFIG_PATH), _DEFAULT_SYSCTL_BYTES
         )
         if not success:
             return TuneResult(
@@ -134,7 +224,7 @@ def apply_sysctl_profile(enable: bool) -> TuneResult:
                 message=f"Failed to reset sysctl config: {error}",
             )
 
-        ok, err = pkexec_sysctl_system()
+        ok, err = _write_sysctl_live(_DEFAULT_SYSCTL_DICT)
         if not ok:
             return TuneResult(
                 success=False,
@@ -158,16 +248,14 @@ def apply_sysctl_values(settings: dict[str, str]) -> TuneResult:
         return TuneResult(success=True, changed=False, message="No settings provided.")
 
     from core.utils.io import pkexec_write
-    from core.utils.privilege import pkexec_sysctl_system
 
-    final_config = {}
-    if current_content := read_file(SYSCTL_CONFIG_PATH):
-        for line in current_content.splitlines():
-            if (line := line.strip()) and not line.startswith("#") and "=" in line:
-                k, v = (p.strip() for p in line.split("=", 1))
-                final_config[k] = v
+    final_config = _parse_sysctl(read_file(SYSCTL_CONFIG_PATH) or "")
 
-    changed = any(final_config.get(k) != str(v) for k, v in settings.items())
+    changed = False
+    for k, v in settings.items():
+        if final_config.get(k) != (v := str(v)):
+            final_config[k] = v
+            changed = True
 
     if not changed and SYSCTL_CONFIG_PATH.exists():
         return TuneResult(
@@ -176,9 +264,6 @@ def apply_sysctl_values(settings: dict[str, str]) -> TuneResult:
             message="Settings are already applied in config.",
         )
 
-    for k, v in settings.items():
-        final_config[k] = str(v)
-
     new_lines = ["# Custom Z-Manager Tuning Configuration"]
     new_lines.extend(f"{k} = {v}" for k, v in sorted(final_config.items()))
     new_content = "\n".join(new_lines) + "\n"
@@ -189,7 +274,7 @@ def apply_sysctl_values(settings: dict[str, str]) -> TuneResult:
             success=False, changed=False, message=f"Failed to write config: {error}"
         )
 
-    ok, err = pkexec_sysctl_system()
+    ok, err = _write_sysctl_live(final_config)
     if not ok:
         return TuneResult(
             success=False,
@@ -204,12 +289,26 @@ def apply_sysctl_values(settings: dict[str, str]) -> TuneResult:
     )
 
 
-def set_zswap_in_grub(enabled: bool) -> TuneResult:
+def apply_sysctl_values_batch(settings_list: list[dict[str, str]]) -> TuneResult:
+    """
+    Applies several groups of sysctl values with one file write and one reload.
+    Later groups win when the same key appears more than once.
+    """
+    merged: dict[str, str] = {}
+    for settings in settings_list:
+        merged.update(settings)
+    return apply_sysctl_values(merged)
+
+
+def set_zswap_in_grub(
+    enabled: bool, snapshot: BootConfigSnapshot | None = None
+) -> TuneResult:
     """
     Manages the kernel parameter to disable zswap permanently via GRUB.
     This function only writes the file; it does not run update-grub.
     """
-    if detect_bootloader() != "grub":
+    bootloader = snapshot.bootloader if snapshot else detect_bootloader()
+    if bootloader != "grub":
         return TuneResult(
             success=False,
             changed=False,
@@ -219,25 +318,27 @@ def set_zswap_in_grub(enabled: bool) -> TuneResult:
 
     from core.utils.io import pkexec_write
 
+    current = (
+        snapshot.grub_zswap_content if snapshot else read_file(GRUB_ZSWAP_DISABLE_PATH)
+    )
     if not enabled:
-        if is_kernel_param_active("zswap.enabled=0"):
+        if current and GRUB_ZSWAP_DISABLE_CONTENT in current:
             return TuneResult(
                 success=True,
                 changed=False,
-                message="ZSwap is already disabled in the current boot session.",
+                message="GRUB configuration to disable zswap already exists.",
+                action_needed="update-grub",
             )
 
-        current = read_file(GRUB_ZSWAP_DISABLE_PATH)
-        if current and GRUB_ZSWAP_DISABLE_CONTENT in current:
+        if is_kernel_param_active("zswap.enabled=0"):
             return TuneResult(
                 success=True,
                 changed=False,
-                message="GRUB configuration to disable zswap already exists.",
-                action_needed="update-grub",
+                message="ZSwap is already disabled in the current boot session.",
             )
 
         success, error = pkexec_write(
-            str(GRUB_ZSWAP_DISABLE_PATH), GRUB_ZSWAP_DISABLE_CONTENT + "\n"
+            str(GRUB_ZSWAP_DISABLE_PATH), _GRUB_ZSWAP_BYTES
         )
         if not success:
             return TuneResult(
@@ -252,7 +353,6 @@ def set_zswap_in_grub(enabled: bool) -> TuneResult:
             action_needed="update-grub",
         )
     else:
-        current = read_file(GRUB_ZSWAP_DISABLE_PATH)
         if not current or GRUB_ZSWAP_DISABLE_CONTENT not in current:
             return TuneResult(
                 success=True,
@@ -261,7 +361,8 @@ def set_zswap_in_grub(enabled: bool) -> TuneResult:
             )
 
         success, error = pkexec_write(
-            str(GRUB_ZSWAP_DISABLE_PATH), "# ZSwap disabling removed by Z-Manager\n"
+            str(GRUB_ZSWAP_DISABLE_PATH),
+            "# ZSwap disabling removed by Z-Manager\n"
         )
         if not success:
             return TuneResult(
@@ -277,12 +378,15 @@ def set_zswap_in_grub(enabled: bool) -> TuneResult:
         )
 
 
-def set_psi_in_grub(enabled: bool) -> TuneResult:
+def set_psi_in_grub(
+    enabled: bool, snapshot: BootConfigSnapshot | None = None
+) -> TuneResult:
     """
     Manages the kernel parameter to enable/disable PSI permanently via GRUB.
     This function only writes the file; it does not run update-grub.
     """
-    if detect_bootloader() != "grub":
+    bootloader = snapshot.bootloader if snapshot else detect_bootloader()
+    if bootloader != "grub":
         return TuneResult(
             success=False,
             changed=False,
@@ -292,25 +396,25 @@ def set_psi_in_grub(enabled: bool) -> TuneResult:
 
     from core.utils.io import pkexec_write
 
+    current = snapshot.grub_psi_content if snapshot else read_file(GRUB_PSI_ENABLE_PATH)
     if enabled:
-        if is_kernel_param_active("psi=1"):
+        if current and GRUB_PSI_ENABLE_CONTENT in current:
             return TuneResult(
                 success=True,
                 changed=False,
-                message="PSI is already enabled in the current boot session.",
+                message="GRUB configuration to enable PSI already exists.",
+                action_needed="update-grub",
             )
 
-        current = read_file(GRUB_PSI_ENABLE_PATH)
-        if current and GRUB_PSI_ENABLE_CONTENT in current:
+        if is_kernel_param_active("psi=1"):
             return TuneResult(
                 success=True,
                 changed=False,
-                message="GRUB configuration to enable PSI already exists.",
-                action_needed="update-grub",
+                message="PSI is already enabled in the current boot session.",
             )
 
         success, error = pkexec_write(
-            str(GRUB_PSI_ENABLE_PATH), GRUB_PSI_ENABLE_CONTENT + "\n"
+            str(GRUB_PSI_ENABLE_PATH), _GRUB_PSI_BYTES
         )
         if not success:
             return TuneResult(
@@ -325,7 +429,6 @@ def set_psi_in_grub(enabled: bool) -> TuneResult:
             action_needed="update-grub",
         )
     else:
-        current = read_file(GRUB_PSI_ENABLE_PATH)
         if not current or GRUB_PSI_ENABLE_CONTENT not in current:
             return TuneResult(
                 success=True,
@@ -334,7 +437,8 @@ def set_psi_in_grub(enabled: bool) -> TuneResult:
             )
 
         success, error = pkexec_write(
-            str(GRUB_PSI_ENABLE_PATH), "# PSI enabling removed by Z-Manager\n"
+            str(GRUB_PSI_ENABLE_PATH),
+            "# PSI enabling removed by Z-Manager\n"
         )
         if not success:
             return TuneResult(
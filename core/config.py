@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, NamedTuple
 from configobj import ConfigObj
-import io
-import subprocess
+import os
+import re
+import time
 from pathlib import Path
 
 from core.utils.common import run, SystemCommandError
-from core.utils.privilege import systemd_daemon_reload, systemd_try_restart
+from core.utils.privilege import systemd_daemon_reload, systemd_try_restart, systemd_restart_if_active
 
 # Standard systemd lookup paths (Legacy/Fallback)
 SEARCH_PATHS = [
@@ -19,16 +20,37 @@ SEARCH_PATHS = [
     Path("/usr/local/lib/systemd/zram-generator.conf")
 ]
 
+# SEARCH_PATHS paired with their string form so lookups stat a plain str.
+_SEARCH_PATH_PAIRS: Tuple[Tuple[Path, str], ...] = tuple((p, str(p)) for p in SEARCH_PATHS)
+
 # Canonical path for writing changes (always /etc)
 CONFIG_PATH = "/etc/systemd/zram-generator.conf"
 
-@dataclass(frozen=True)
-class ConfigResult:
+# Last resolved active config path. Within _PATH_TTL seconds of the lookup it
+# is reused without any stat(); writers reset it through invalidate_config_cache().
+_PATH_TTL = 1.0
+_PATH_CHECKED_AT: Optional[Tuple[float, Path]] = None
+
+# Raw config text keyed by path and tagged with the st_mtime_ns it was read at.
+# Parsed ConfigObj instances are not cached: callers mutate them, and
+# re-parsing cached lines is cheaper than deep-copying a parsed tree.
+_TEXT_CACHE: Dict[str, Tuple[int, str]] = {}
+
+# Last 'systemd-analyze cat-config' output for the real root, tagged with the
+# stat signature of every file it merges, so unchanged configs skip the fork.
+_CAT_CONFIG_CACHE: Optional[Tuple[tuple, str]] = None
+
+# Section header and inline-comment rules as ConfigObj applies them
+# (list_values=False): a quoted value is kept whole, otherwise '#' starts a comment.
+_SECTION_RE = re.compile(r'^\s*\[\s*([^\[\]]+?)\s*\]\s*(#.*)?$')
+_VALUE_RE = re.compile(r'''^((?:".*?")|(?:'.*?')|(?:[^'"#].*?)|(?:))\s*(?:#.*)?$''')
+
+class ConfigResult(NamedTuple):
     success: bool
     device: str
     applied: bool
     message: str
-    rendered: str
+    rendered: str = ""
 
 @dataclass
 class EffectiveConfig:
@@ -38,7 +60,85 @@ class EffectiveConfig:
 
 def get_active_config_path() -> Optional[Path]:
     """Returns the primary (highest priority) config file path."""
-    return next((p for p in SEARCH_PATHS if p.exists()), Path(CONFIG_PATH))
+    global _PATH_CHECKED_AT
+    now = time.monotonic()
+    if _PATH_CHECKED_AT is not None and now - _PATH_CHECKED_AT[0] < _PATH_TTL:
+        return _PATH_CHECKED_AT[1]
+
+    # Which file wins depends only on which ones exist, so every lookup past the
+    # TTL re-probes in priority order; a newly created /etc file takes over.
+    for path, path_str in _SEARCH_PATH_PAIRS:
+        try:
+            os.stat(path_str)
+        except OSError:
+            continue
+        _PATH_CHECKED_AT = (now, path)
+        return path
+
+    _PATH_CHECKED_AT = (now, Path(CONFIG_PATH))
+    return _PATH_CHECKED_AT[1]
+
+def load_config_text(path: Path) -> str:
+    """Returns the text of a config file, re-reading it only when its mtime changes."""
+    key = str(path)
+    cached = _TEXT_CACHE.get(key)
+    if cached is not None and os.stat(key).st_mtime_ns == cached[0]:
+        return cached[1]
+    # Miss: take the mtime from the open fd so it always matches the text read
+    with open(key, encoding='utf-8') as f:
+        cached = _TEXT_CACHE[key] = (os.fstat(f.fileno()).st_mtime_ns, f.read())
+    return cached[1]
+
+def _load_config_file(path: Path) -> ConfigObj:
+    """Parses a config file from its cached text. Each call returns a fresh object."""
+    return ConfigObj(load_config_text(path).splitlines(), list_values=False, encoding='utf-8')
+
+def _config_signature() -> tuple:
+    """(path, mtime_ns, size) of every zram-generator.conf and drop-in systemd would merge."""
+    sig = []
+    for _, conf in _SEARCH_PATH_PAIRS:
+        try:
+            st = os.stat(conf)
+            sig.append((conf, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+        try:
+            with os.scandir(f"{conf}.d") as entries:
+                for entry in entries:
+                    if entry.name.endswith(".conf"):
+                        st = entry.stat()
+                        sig.append((entry.path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+    return tuple(sorted(sig))
+
+def _cat_config(root: Optional[str] = None) -> str:
+    """
+    Runs 'systemd-analyze cat-config' for zram-generator.conf.
+    Without an alternate root the output is reused until a merged file changes.
+    """
+    global _CAT_CONFIG_CACHE
+    if root is None:
+        sig = _config_signature()
+        if _CAT_CONFIG_CACHE is not None and _CAT_CONFIG_CACHE[0] == sig:
+            return _CAT_CONFIG_CACHE[1]
+
+    cmd = ["systemd-analyze"]
+    if root:
+        cmd.extend([f"--root={root}"])
+    cmd.extend(["cat-config", "systemd/zram-generator.conf"])
+    out = run(cmd, check=True).out
+
+    if root is None:
+        _CAT_CONFIG_CACHE = (sig, out)
+    return out
+
+def invalidate_config_cache() -> None:
+    """Drops all cached config lookups; call after writing zram-generator.conf."""
+    global _PATH_CHECKED_AT, _CAT_CONFIG_CACHE
+    _PATH_CHECKED_AT = None
+    _CAT_CONFIG_CACHE = None
+    _TEXT_CACHE.clear()
 
 def _parse_systemd_cat_config(raw_output: str) -> EffectiveConfig:
     """
@@ -87,16 +187,10 @@ def load_effective_config_state(root: Optional[str] = None) -> EffectiveConfig:
     Uses systemd-analyze to merge the entire hierarchy (including .d directories).
     Optional 'root' parameter allows operating on an alternate filesystem root.
     """
-    cmd = ["systemd-analyze"]
-    if root:
-        cmd.extend([f"--root={root}"])
-    cmd.extend(["cat-config", "systemd/zram-generator.conf"])
-
     try:
         # We use systemd-analyze cat-config to let systemd handle the complex merging rules.
-        res = run(cmd, check=True)
-        if res.out:
-            return _parse_systemd_cat_config(res.out)
+        if out := _cat_config(root):
+            return _parse_systemd_cat_config(out)
     except (SystemCommandError, FileNotFoundError):
         # Fallback to single-file read if systemd-analyze is unavailable or fails
         pass
@@ -105,51 +199,81 @@ def load_effective_config_state(root: Optional[str] = None) -> EffectiveConfig:
     # Note: Traditional fallback doesn't easily support 'root' without more logic,
     # so we prioritize the systemd-analyze path.
     path = get_active_config_path()
-    cfg = ConfigObj(str(path), list_values=False, encoding='utf-8') if path and path.exists() else ConfigObj()
+    try:
+        cfg = _load_config_file(path) if path else ConfigObj()
+    except OSError:
+        cfg = ConfigObj()
     return EffectiveConfig(config=cfg)
 
 def read_zram_config() -> ConfigObj:
     """Read the merged, effective zram-generator configuration."""
     return load_effective_config_state().config
 
+def _scan_section(raw: str, section: str) -> Dict[str, str]:
+    """
+    Collects one section's keys from raw config text without building a ConfigObj.
+    Every occurrence of the section is merged, last value wins, as in cat-config.
+    """
+    values: Dict[str, str] = {}
+    inside = False
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        if line[0] == "[":
+            m = _SECTION_RE.match(line)
+            inside = m is not None and m.group(1) == section
+        elif inside and "=" in line:
+            key, _, value = line.partition("=")
+            value = value.strip()
+            if m := _VALUE_RE.match(value):
+                value = m.group(1)
+            values[key.strip()] = value
+    return values
+
 def read_global_config() -> Dict[str, str]:
     """Reads the merged [zram-generator] global section."""
-    cfg = read_zram_config()
-    return dict(cfg["zram-generator"]) if "zram-generator" in cfg else {}
+    return _scan_section(load_effective_config(), "zram-generator")
 
 def load_effective_config(root: Optional[str] = None) -> str:
     """Returns the raw concatenated string from systemd-analyze or the best-found file."""
-    cmd = ["systemd-analyze"]
-    if root:
-        cmd.extend([f"--root={root}"])
-    cmd.extend(["cat-config", "systemd/zram-generator.conf"])
-
     try:
-        res = run(cmd, check=True)
-        if res.out:
-            return res.out
+        if out := _cat_config(root):
+            return out
     except Exception:
         pass
     
     path = get_active_config_path()
-    return path.read_text(encoding='utf-8') if path and path.exists() else ""
+    try:
+        return load_config_text(path) if path else ""
+    except OSError:
+        return ""
 
 def apply_config_with_restart(device: str, restart_mode: str = "try") -> ConfigResult:
     """Reload systemd and optionally restart the zram unit for the given device."""
+    # Same guard as the writers: the global section is not a device unit
+    if device == "zram-generator":
+        return ConfigResult(success=False, device=device, applied=False, message="'zram-generator' is the global section, not a device")
+
     try:
         systemd_daemon_reload()
     except SystemCommandError as e:
-        return ConfigResult(success=False, device=device, applied=False, message=f"daemon-reload failed: {e}", rendered="")
+        return ConfigResult(success=False, device=device, applied=False, message=f"daemon-reload failed: {e}")
 
     if restart_mode == "none":
-        return ConfigResult(success=True, device=device, applied=False, message="daemon-reload only", rendered="")
+        return ConfigResult(success=True, device=device, applied=False, message="daemon-reload only")
 
     svc = f"systemd-zram-setup@{device}.service"
-    ok, err = systemd_try_restart(svc)
+    if restart_mode == "try":
+        # Inactive units stay down; systemd decides atomically and waits for the job
+        ok, err = systemd_restart_if_active(svc)
+        done = "restarted if active"
+    else:
+        ok, err = systemd_try_restart(svc)
+        done = "restarted"
     return ConfigResult(
         success=ok, 
         device=device, 
         applied=ok, 
-        message="restarted" if ok else f"restart failed: {err or ''}".strip(), 
-        rendered=""
-    )
\ No newline at end of file
+        message=done if ok else f"restart failed: {err or ''}".strip(),
+    )
@@ -2,34 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, List
 from configobj import ConfigObj
 import io
 import re
 
-from core.config import CONFIG_PATH, get_active_config_path
+from core.config import CONFIG_PATH, get_active_config_path, _load_config_file, load_config_text, _SECTION_RE
+from core.utils.common import ValidationError
 from pathlib import Path
 
+# Allow alphanumeric, operators, parenthesis, comma, dot, and space
+_SIZE_RE = re.compile(r'^[\w\s\+\-\*\/\%\(\)\.\,]+$')
+# Allow alphanumeric and parens/equals (e.g. zstd(level=1))
+_ALGO_RE = re.compile(r'^[a-zA-Z0-9\-\(\)\=\s]+$')
+
+def _normalize(text: str) -> str:
+    """Canonical file form: trailing whitespace collapsed to a single newline."""
+    return text.rstrip() + "\n"
+
+def _render(cfg: ConfigObj) -> str:
+    """
+    Serialises a ConfigObj straight to text in canonical form.
+    With an encoding set, write() hands back bytes lines, so the encoding is
+    dropped first to get str lines without an encode/decode round-trip.
+    """
+    if cfg.BOM:
+        # write() prepends the BOM as bytes; keep the stream path for that case
+        s = io.BytesIO()
+        cfg.write(s)
+        return _normalize(s.getvalue().decode('utf-8'))
+    cfg.encoding = None
+    return _normalize("\n".join(cfg.write()))
+
 def _read_local_config() -> ConfigObj:
     """Reads the specific target configuration file for editing to preserve structure and comments."""
     path = get_active_config_path()
     if path and path.exists():
-        return ConfigObj(str(path), list_values=False, encoding='utf-8')
+        return _load_config_file(path)
     return ConfigObj(list_values=False, encoding='utf-8')
 def generate_config_string(size_formula: str, algorithm: str, priority: int, device: str = "zram0", writeback_device: Optional[str] = None) -> str:
     """
-    Create a zram-generator.conf configuration as a string using ConfigObj.
+    Create a zram-generator.conf configuration as a string.
+    The shape is fixed, so the lines are formatted directly; the output matches
+    what ConfigObj would render for the same single section.
     """
-    cfg = ConfigObj(list_values=False, encoding='utf-8')
-    cfg[device] = {}
-    cfg[device]["zram-size"] = size_formula
-    cfg[device]["compression-algorithm"] = algorithm
-    cfg[device]["swap-priority"] = str(priority)
-    
+    lines = [
+        f"[{device}]",
+        f"zram-size = {size_formula}",
+        f"compression-algorithm = {algorithm}",
+        f"swap-priority = {priority}",
+    ]
     if writeback_device:
-        cfg[device]["writeback-device"] = writeback_device
+        lines.append(f"writeback-device = {writeback_device}")
 
-    return "\n".join(cfg.write()).strip()
+    return "\n".join(lines)
 
 
 def validate_updates(updates: Dict[str, Any]) -> Optional[str]:
@@ -60,13 +86,11 @@ def validate_updates(updates: Dict[str, Any]) -> Optional[str]:
         # 3. Specialized Field Validation
         match key:
             case "zram-size":
-                # Allow alphanumeric, operators, parenthesis, comma, dot, and space
-                if not re.match(r'^[\w\s\+\-\*\/\%\(\)\.\,]+$', val_str):
+                if not _SIZE_RE.match(val_str):
                     return f"Invalid zram-size format: {val_str!r}"
             
             case "compression-algorithm":
-                # Allow alphanumeric and parens/equals (e.g. zstd(level=1))
-                if not re.match(r'^[a-zA-Z0-9\-\(\)\=\s]+$', val_str):
+                if not _ALGO_RE.match(val_str):
                     return f"Invalid compression-algorithm format: {val_str!r}"
             
             case "swap-priority":
@@ -75,10 +99,112 @@ def validate_updates(updates: Dict[str, Any]) -> Optional[str]:
 
     return None
 
+_KEY_LINE_RE = re.compile(
+    r'^(?P<prefix>[ \t]*(?P<key>[^\s=#\[][^=]*?)[ \t]*=[ \t]*)(?P<value>[^#\r\n]*?)(?P<comment>[ \t]*#[^\r\n]*)?(?P<eol>\r?\n)?$'
+)
+
+def _is_comment_or_blank(line: str) -> bool:
+    stripped = line.strip()
+    return not stripped or stripped.startswith("#")
+
+def _read_local_text() -> str:
+    """Raw text of the file _read_local_config() would parse, or '' if it is absent."""
+    path = get_active_config_path()
+    return load_config_text(path) if path and path.exists() else ""
+
+def _split_sections(text: str) -> Optional[Tuple[List[str], List[Tuple[int, str]]]]:
+    """
+    Splits raw config text into lines and (line_index, name) section headers.
+    Returns None for text that is not safe to edit line-wise (nested sections,
+    multi-line values); callers then fall back to ConfigObj.
+    """
+    if '"""' in text or "'''" in text:
+        return None
+
+    lines = text.splitlines(keepends=True)
+    headers = []
+    for i, line in enumerate(lines):
+        head = line.lstrip()
+        # Key and comment lines are the bulk of the file; only '[' can start a header
+        if not head.startswith("["):
+            continue
+        if head.startswith("[["):
+            return None
+        if m := _SECTION_RE.match(line):
+            headers.append((i, m.group(1)))
+    return lines, headers
+
+def _patch_section_text(text: str, device: str, updates: Dict[str, Any]) -> Optional[str]:
+    """
+    Rewrites values of keys that already exist in one section, in place.
+    Anything structural (new or deleted keys, new sections, values ConfigObj
+    would quote) returns None so the caller re-renders through ConfigObj.
+    """
+    split = _split_sections(text)
+    if split is None:
+        return None
+    lines, headers = split
+
+    matches = [n for n, (_, name) in enumerate(headers) if name == device]
+    if len(matches) != 1:
+        return None
+    n = matches[0]
+    start = headers[n][0] + 1
+    end = headers[n + 1][0] if n + 1 < len(headers) else len(lines)
+
+    for key, value in updates.items():
+        if value is None:
+            return None
+        val = str(value)
+        if val != val.strip() or "#" in val or val[:1] in ("'", '"'):
+            return None
+
+        hits = [i for i in range(start, end) if (m := _KEY_LINE_RE.match(lines[i])) and m["key"] == key]
+        if len(hits) != 1:
+            return None
+        m = _KEY_LINE_RE.match(lines[hits[0]])
+        if not m["value"] or m["value"][:1] in ("'", '"'):
+            return None
+        lines[hits[0]] = f"{m['prefix']}{val}{m['comment'] or ''}{m['eol'] or ''}"
+
+    return "".join(lines)
+
+def _remove_section_text(text: str, device: str) -> Optional[str]:
+    """
+    Cuts one section out of the raw config text without a ConfigObj round-trip.
+    Like ConfigObj, comments directly above a header belong to that section
+    (except the file's leading comment block). Returns None when the text
+    is not simple enough to slice safely; the caller then falls back to ConfigObj.
+    """
+    split = _split_sections(text)
+    if split is None:
+        return None
+    lines, headers = split
+
+    matches = [n for n, (_, name) in enumerate(headers) if name == device]
+    if len(matches) != 1:
+        return None if matches else text
+    n = matches[0]
+
+    start = headers[n][0]
+    while start > 0 and _is_comment_or_blank(lines[start - 1]):
+        start -= 1
+    if not any(not _is_comment_or_blank(l) for l in lines[:start]):
+        start = headers[n][0]
+
+    end = len(lines)
+    if n + 1 < len(headers):
+        end = headers[n + 1][0]
+        while end > headers[n][0] + 1 and _is_comment_or_blank(lines[end - 1]):
+            end -= 1
+
+    return "".join(lines[:start] + lines[end:])
+
 def update_zram_config(device: str, updates: Dict[str, Any]) -> Tuple[bool, Optional[str], str]:
     """
     Merge updates into an existing zram-generator.conf for the given device.
-    Uses ConfigObj to preserve comments and structure.
+    Value changes to existing keys are patched into the text; anything else
+    goes through ConfigObj, which also preserves comments and structure.
     Returns (success, error, rendered_config_string).
     """
     # Protection: Do not allow using the global section [zram-generator] as a device
@@ -90,6 +216,16 @@ def update_zram_config(device: str, updates: Dict[str, Any]) -> Tuple[bool, Opti
     if err:
         return False, err, ""
 
+    try:
+        text = _read_local_text()
+    except OSError as e:
+        return False, str(e), ""
+
+    # Common case: changing values that already exist, patched straight into the text
+    patched = _patch_section_text(text, device, updates)
+    if patched is not None:
+        return True, None, _normalize(patched)
+
     cfg = _read_local_config()
     if device not in cfg:
         cfg[device] = {}
@@ -103,15 +239,7 @@ def update_zram_config(device: str, updates: Dict[str, Any]) -> Tuple[bool, Opti
             cfg[device][key] = str(value)
 
     try:
-        # ConfigObj.write() writes to file if filename is set. 
-        # We want the string representation.
-        # We can capture it by passing an output-like object or simply getting it back.
-        # Simplest way: set filename to None temporary or use output
-        s = io.BytesIO()
-        cfg.write(s)
-        # Decode bytes to string
-        rendered = s.getvalue().decode('utf-8').strip()
-        return True, None, rendered
+        return True, None, _render(cfg)
     except Exception as e:
         return False, str(e), ""
 
@@ -172,16 +300,22 @@ def remove_device_from_config(device: str) -> Tuple[bool, Optional[str], str]:
     Remove an entire device section from the configuration.
     Returns (ok, error, rendered_config_string).
     """
+    try:
+        text = _read_local_text()
+    except OSError as e:
+        return False, str(e), ""
+
+    # Purely textual edit: slice the section out and keep the rest byte-for-byte
+    sliced = _remove_section_text(text, device)
+    if sliced is not None:
+        return True, None, _normalize(sliced)
+
     cfg = _read_local_config()
     if device in cfg:
         del cfg[device]
     
-    # We must write to string to render it
-    s = io.BytesIO()
     try:
-        cfg.write(s)
-        rendered = s.getvalue().decode('utf-8').strip()
-        return True, None, rendered
+        return True, None, _render(cfg)
     except Exception as e:
         return False, str(e), ""
 
@@ -209,9 +343,53 @@ def update_global_config(updates: Dict[str, Any]) -> Tuple[bool, Optional[str],
             cfg[section][key] = str(value)
             
     try:
-        s = io.BytesIO()
-        cfg.write(s)
-        rendered = s.getvalue().decode('utf-8').strip()
-        return True, None, rendered
+        return True, None, _render(cfg)
     except Exception as e:
         return False, str(e), ""
+
+
+class ConfigTransaction:
+    """
+    Batches edits to several sections into one read and one render.
+
+        with ConfigTransaction() as tx:
+            tx.update("zram0", {"writeback-device": "/dev/sdb1"})
+            tx.remove("zram1")
+        write(tx.rendered)
+
+    update() raises ValidationError; on any exception nothing is rendered.
+    """
+
+    def __init__(self) -> None:
+        self.cfg: Optional[ConfigObj] = None
+        self.rendered: str = ""
+
+    def __enter__(self) -> "ConfigTransaction":
+        self.cfg = _read_local_config()
+        return self
+
+    def update(self, device: str, updates: Dict[str, Any]) -> None:
+        """Merges updates into a device section, creating it if needed."""
+        if device == "zram-generator":
+            raise ValidationError("The section 'zram-generator' is reserved for global settings and cannot be used as a device name.")
+        err = validate_updates(updates)
+        if err:
+            raise ValidationError(err)
+
+        if device not in self.cfg:
+            self.cfg[device] = {}
+        for key, value in updates.items():
+            if value is None:
+                if key in self.cfg[device]:
+                    del self.cfg[device][key]
+            else:
+                self.cfg[device][key] = str(value)
+
+    def remove(self, device: str) -> None:
+        """Drops an entire device section."""
+        if device in self.cfg:
+            del self.cfg[device]
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.rendered = _render(self.cfg)
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple
 
 from core.utils.common import (
-    run,
+    run_status,
     SystemCommandError,
     ValidationError,
     NotBlockDeviceError,
@@ -29,11 +29,18 @@ from core.utils.privilege import (
     systemd_try_restart,
     systemd_restart,
 )
-from core.config import CONFIG_PATH, read_zram_config
+from core.config import (
+    CONFIG_PATH,
+    read_zram_config,
+    invalidate_config_cache,
+    load_config_text,
+    _scan_section,
+)
 from core.config_writer import (
     update_zram_config, 
     update_global_config, 
-    remove_device_from_config
+    remove_device_from_config,
+    ConfigTransaction,
 )
 from .types import (
     UnitResult, 
@@ -49,14 +56,26 @@ _LOGGER = logging.getLogger(__name__)
 
 # --- Configuration Actions ---
 
+def _current_config_text() -> str:
+    """Text currently on disk at CONFIG_PATH, or "" when there is no file yet."""
+    try:
+        return load_config_text(CONFIG_PATH)
+    except OSError:
+        return ""
+
+
 def apply_device_config(device_name: str, config_updates: Dict[str, Any], restart_service: bool = False, reload_daemon: bool = True) -> UnitResult:
     """Orchestrates writing a config to disk and optionally applying it via systemd."""
     try:
         ok, err, rendered = update_zram_config(device_name, config_updates)
         if not ok: return UnitResult(False, f"Config generation failed: {err}")
+        if rendered == _current_config_text():
+            # Nothing to write, so the running unit already reflects this config
+            return UnitResult(True, "Configuration unchanged.")
 
         ok_write, err_write = pkexec_write(CONFIG_PATH, rendered)
         if not ok_write: return UnitResult(False, f"Write failed: {err_write}")
+        invalidate_config_cache()
 
         if reload_daemon:
             ok_reload, err_reload = pkexec_daemon_reload()
@@ -82,6 +101,7 @@ def apply_global_config(updates: Dict[str, Any]) -> UnitResult:
             
         ok_w, err_w = pkexec_write(CONFIG_PATH, rendered)
         if not ok_w: return UnitResult(False, f"Write failed: {err_w}")
+        invalidate_config_cache()
             
         ok_reload, err_reload = pkexec_daemon_reload()
         if not ok_reload: return UnitResult(False, f"Daemon reload failed: {err_reload}")
@@ -103,6 +123,7 @@ def remove_device_config(device_name: str, apply_now: bool = True) -> UnitResult
             
         ok_w, err_w = pkexec_write(CONFIG_PATH, rendered)
         if not ok_w: return UnitResult(False, f"Write failed: {err_w}")
+        invalidate_config_cache()
              
         if apply_now:
             pkexec_daemon_reload()
@@ -112,6 +133,73 @@ def remove_device_config(device_name: str, apply_now: bool = True) -> UnitResult
         return UnitResult(False, str(e))
 
 
+def apply_config_batch(updates_by_device: Dict[str, Optional[Dict[str, Any]]], apply_now: bool = False) -> Dict[str, UnitResult]:
+    """
+    Applies edits to several devices with a single read, write and daemon-reload.
+    A value of None removes that device's section. Returns a result per device;
+    a device whose updates fail validation is reported on its own and left out
+    of the write, while the other devices are still applied. Devices whose
+    section comes out unchanged are neither written nor restarted.
+    """
+    removed = [dev for dev, updates in updates_by_device.items() if updates is None]
+    updated = [dev for dev, updates in updates_by_device.items() if updates is not None]
+    invalid: Dict[str, UnitResult] = {}
+
+    def _fail_all(message: str) -> Dict[str, UnitResult]:
+        return {dev: invalid.get(dev, UnitResult(False, message)) for dev in updates_by_device}
+
+    try:
+        if apply_now:
+            for dev in removed:
+                pkexec_systemctl("stop", f"systemd-zram-setup@{dev}.service")  # Best effort
+
+        with ConfigTransaction() as tx:
+            for dev in removed:
+                tx.remove(dev)
+            for dev in updated:
+                try:
+                    # update() validates before touching the section, so a bad device leaves no trace
+                    tx.update(dev, updates_by_device[dev])
+                except ValidationError as e:
+                    invalid[dev] = UnitResult(False, f"Config generation failed for {dev}: {e}")
+        updated = [dev for dev in updated if dev not in invalid]
+
+        current = _current_config_text()
+        # Restart only devices whose own section changed on disk
+        unchanged = [dev for dev in updated if _scan_section(current, dev) == _scan_section(tx.rendered, dev)]
+        updated = [dev for dev in updated if dev not in unchanged]
+        written = bool(removed or updated) and tx.rendered != current
+        if written:
+            ok_w, err_w = pkexec_write(CONFIG_PATH, tx.rendered)
+            if not ok_w: return _fail_all(f"Write failed: {err_w}")
+            invalidate_config_cache()
+    except Exception as e:
+        return _fail_all(str(e))
+
+    results = {dev: UnitResult(True, f"Device {dev} removed.") for dev in removed}
+    results.update(invalid)
+    results.update({dev: UnitResult(True, "Configuration unchanged.") for dev in unchanged})
+    if not apply_now:
+        results.update({dev: UnitResult(True, "Configuration saved. Restart required to apply.") for dev in updated})
+        return results
+    if not written:
+        # Nothing reached the disk, so there is nothing to reload or restart
+        return results
+
+    ok_reload, err_reload = pkexec_daemon_reload()
+    if not ok_reload:
+        results.update({dev: UnitResult(False, f"Daemon reload failed: {err_reload}") for dev in updated})
+        return results
+
+    for dev in updated:
+        restart_res = restart_unit_for_device(dev)
+        if restart_res.success:
+            results[dev] = UnitResult(True, "Configuration applied successfully.")
+        else:
+            results[dev] = UnitResult(False, f"Service restart failed: {restart_res.message}")
+    return results
+
+
 # --- Live Writeback Actions ---
 
 def set_writeback(device_name: str, writeback_device: str, force: bool = False, create_if_missing: bool = True, default_size: str = "1G", new_size: Optional[str] = None) -> WritebackResult:
@@ -132,8 +220,8 @@ def set_writeback(device_name: str, writeback_device: str, force: bool = False,
         raise NotBlockDeviceError(f"Device {device_name} does not exist; set create_if_missing=True to auto-create")
 
     if active:
-        run(["swapoff", f"/dev/{device_name}"], check=False)
-        run(["umount", f"/dev/{device_name}"], check=False)
+        run_status(["swapoff", f"/dev/{device_name}"])
+        run_status(["umount", f"/dev/{device_name}"])
 
     params = read_params_best_effort(device_name, default_size)
     size = new_size or params.get("disksize") or default_size
@@ -161,8 +249,8 @@ def clear_writeback(device_name: str, force: bool = False, create_if_missing: bo
         raise NotBlockDeviceError(f"Device {device_name} does not exist; set create_if_missing=True to auto-create")
 
     if active:
-        run(["swapoff", f"/dev/{device_name}"], check=False)
-        run(["umount", f"/dev/{device_name}"], check=False)
+        run_status(["swapoff", f"/dev/{device_name}"])
+        run_status(["umount", f"/dev/{device_name}"])
 
     params = read_params_best_effort(device_name, default_size)
     size = new_size or params.get("disksize") or default_size
@@ -199,12 +287,14 @@ def persist_writeback(device_name: str, writeback_device: Optional[str], apply_n
 
         write_ok, write_err = atomic_write_to_file(CONFIG_PATH, rendered, backup=True)
         if not write_ok: raise ValidationError(write_err)
+        invalidate_config_cache()
 
         applied = False
         msg = "Persisted"
         if apply_now:
+            svc = f"systemd-zram-setup@{device_name}.service"
             systemd_daemon_reload()
-            ok_restart, restart_err = systemd_try_restart(f"systemd-zram-setup@{device_name}.service")
+            ok_restart, restart_err = systemd_try_restart(svc)
             applied = ok_restart
             if applied:
                 msg = "Persisted and applied"
@@ -9,13 +9,11 @@ from __future__ import annotations
 from typing import List, Optional
 
 from core.utils.common import (
-    run,
-    SystemCommandError,
-    read_file,
+    NotBlockDeviceError,
+    read_sysfs_cached,
 )
 from core.utils.block import is_block_device
-from core.utils.swap import is_device_in_swaps
-from core.utils.zram_stats import zram_sysfs_dir, parse_zramctl_table
+from core.utils.zram_stats import zram_sysfs_dir, parse_zramctl_table, get_zram_mountpoint, get_zram_props
 from .types import DeviceInfo, WritebackStatus
 
 
@@ -46,8 +44,6 @@ def get_writeback_status(device_name: str) -> WritebackStatus:
     """Reads current writeback stats for a specific device."""
     dev_path = f"/dev/{device_name}"
     if not is_block_device(dev_path):
-        from core.utils.common import NotBlockDeviceError
-
         raise NotBlockDeviceError(f"zram device {device_name} does not exist")
 
     return WritebackStatus(
@@ -63,22 +59,14 @@ def get_writeback_status(device_name: str) -> WritebackStatus:
 
 def is_device_active(device_name: str) -> bool:
     """Checks if a device is currently used as swap or mounted."""
-    device_path = f"/dev/{device_name}"
-    if is_device_in_swaps(device_name):
-        return True
-    try:
-        mounts = run(["mount"]).out
-        if device_path in mounts:
-            return True
-    except (SystemCommandError, OSError):
-        pass
-    return False
+    # One pass over /proc/swaps and /proc/mounts instead of forking mount(8)
+    return bool(get_zram_mountpoint(device_name))
 
 
 def _get_sysfs(device_name: str, node: str) -> Optional[str]:
-    """Internal helper to read a specific sysfs node."""
+    """Internal helper to read a specific sysfs node; polled, so the fd is kept open."""
     base = zram_sysfs_dir(device_name)
-    return read_file(f"{base}/{node}")
+    return read_sysfs_cached(f"{base}/{node}")
 
 
 def read_params_best_effort(device_name: str, default_size: str = "1G") -> dict:
@@ -86,12 +74,15 @@ def read_params_best_effort(device_name: str, default_size: str = "1G") -> dict:
     Attempts to read current device parameters before a reset.
     Returns current values to preserve configuration.
     """
-    info_list = parse_zramctl_table()
-    for info in info_list:
-        if info.get("name") == device_name:
-            return {
-                "disksize": info.get("disksize"),
-                "algorithm": info.get("algorithm"),
-                "streams": info.get("streams"),
-            }
+    try:
+        # Only this device's sysfs; an empty index skips the /proc mount lookups
+        info = get_zram_props(device_name, mount_index={})
+    except (IOError, OSError):
+        info = {}
+    if info.get("disksize", "-") != "-":
+        return {
+            "disksize": info.get("disksize"),
+            "algorithm": info.get("algorithm"),
+            "streams": info.get("streams"),
+        }
     return {"disksize": default_size, "algorithm": None, "streams": None}
@@ -16,9 +16,11 @@ from core.utils.common import (
     read_file,
 )
 from core.utils.io import sysfs_write
+from core.utils.block import is_block_device
 from core.utils.zram_stats import (
     zram_sysfs_dir,
     sysfs_reset_device,
+    invalidate_zram_cache,
 )
 from .types import UnitResult
 
@@ -77,6 +79,19 @@ def reconfigure_device_sysfs(
     Low-level kernel reconfiguration.
     Destructive: Resets the device before applying new settings.
     """
+    try:
+        _reconfigure_device_sysfs(device_name, size, algorithm, streams, backing_dev)
+    finally:
+        # Success or partial failure, the device no longer matches any cached listing
+        invalidate_zram_cache()
+
+def _reconfigure_device_sysfs(
+    device_name: str,
+    size: str,
+    algorithm: Optional[str],
+    streams: Optional[int],
+    backing_dev: Optional[str],
+) -> None:
     ensure_device_exists(device_name)
     sysfs_path = zram_sysfs_dir(device_name)
     dev_path = f"/dev/{device_name}"
@@ -121,7 +136,6 @@ def reset_device(device_name: str, confirm: bool = False) -> UnitResult:
     confirm parameter exists for CLI UX compatibility.
     """
     dev_path = f"/dev/{device_name}"
-    from core.utils.block import is_block_device
     if not is_block_device(dev_path):
         return UnitResult(success=False, message=f"Device {device_name} does not exist")
 
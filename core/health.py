@@ -3,32 +3,31 @@
 from __future__ import annotations
 
 import os
-import platform
 import shutil
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
-from core.utils.common import run, read_file
+from core.utils.common import run, read_file_ttl, read_proc_small
 from core.utils.swap import SwapDevice, get_all_swaps as _get_all_swaps
 from modules.journal import python_journal_available
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZswapStatus:
     available: bool
     enabled: Optional[bool]
     detail: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceHealth:
     device: str
     sysfs_ok: bool
     swaps_entry: bool
-    issues: List[str]
+    issues: Tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthReport:
     zramctl_available: bool
     systemd_available: bool
@@ -37,11 +36,14 @@ class HealthReport:
     journal_available: bool
     kernel_version: str
     devices_summary: str
-    notes: List[str]
+    notes: Tuple[str, ...]
 
 
 _CMD_CACHE: Dict[str, bool] = {}
 
+# The running kernel cannot change without a reboot; one uname(2) at import is enough.
+_KERNEL_RELEASE = os.uname().release
+
 
 def _check_cmd_available(cmd: str) -> bool:
     if cmd in _CMD_CACHE:
@@ -52,15 +54,38 @@ def _check_cmd_available(cmd: str) -> bool:
     return available
 
 
+_JOURNAL_OK: Optional[bool] = None
+
+
+def _journal_available() -> bool:
+    """Python journal bindings or journalctl; probed once per process."""
+    global _JOURNAL_OK
+    if _JOURNAL_OK is None:
+        # A failed import is not cached by Python and rescans sys.path each time
+        _JOURNAL_OK = python_journal_available() or _check_cmd_available("journalctl")
+    return _JOURNAL_OK
+
+
+_SYSTEMD_BOOTED: Optional[bool] = None
+
+
+def _is_systemd() -> bool:
+    """sd_booted() equivalent: PID 1 is systemd iff /run/systemd/system exists."""
+    global _SYSTEMD_BOOTED
+    if _SYSTEMD_BOOTED is None:
+        _SYSTEMD_BOOTED = os.path.isdir("/run/systemd/system")
+    return _SYSTEMD_BOOTED
+
+
 def get_zswap_status() -> ZswapStatus:
     enabled_path = "/sys/module/zswap/parameters/enabled"
-    if not os.path.exists(enabled_path):
-        return ZswapStatus(
-            available=False, enabled=None, detail="zswap sysfs not present"
-        )
-
-    val = read_file(enabled_path)
+    val = read_file_ttl(enabled_path)
     if val is None:
+        # Only stat on the failure path to tell "absent" from "unreadable"
+        if not os.path.exists(enabled_path):
+            return ZswapStatus(
+                available=False, enabled=None, detail="zswap sysfs not present"
+            )
         return ZswapStatus(
             available=True, enabled=None, detail="unable to read zswap enabled"
         )
@@ -78,17 +103,13 @@ def _devices_summary() -> str:
     """Count zram devices using sysfs instead of zramctl."""
     try:
         count = 0
-        if not os.path.exists("/sys/block"):
-            return "unable to read /sys/block"
-
         for entry in os.listdir("/sys/block"):
             if entry.startswith("zram"):
                 # Check if device is configured (disksize > 0)
-                disksize_path = f"/sys/block/{entry}/disksize"
-                size_str = read_file(disksize_path)
+                size_str = read_proc_small(f"/sys/block/{entry}/disksize")
                 if size_str:
                     try:
-                        if int(size_str.strip()) > 0:
+                        if int(size_str) > 0:
                             count += 1
                     except ValueError:
                         pass
@@ -96,31 +117,35 @@ def _devices_summary() -> str:
         if count == 0:
             return "no active devices"
         return f"{count} device(s) active"
-    except (OSError, FileNotFoundError):
+    except OSError:
         return "unable to read /sys/block"
 
 
 def check_system_health() -> HealthReport:
     zramctl_ok = _check_cmd_available("zramctl")
-    systemd_ok = _check_cmd_available("systemctl")
     sysfs_ok = _check_sysfs_root()
     zswap = get_zswap_status()
 
+    # Without systemd as PID 1 neither systemctl nor the journal can work, so skip both probes
+    booted = _is_systemd()
+    systemd_ok = booted and _check_cmd_available("systemctl")
     # Check journal availability (Python module or journalctl command)
-    journal_ok = python_journal_available() or _check_cmd_available("journalctl")
+    journal_ok = booted and _journal_available()
 
-    kernel_version = platform.release()
+    kernel_version = _KERNEL_RELEASE
 
     notes: List[str] = []
     if not zramctl_ok:
         notes.append("zramctl not found (optional; not required for functionality)")
-    if not systemd_ok:
+    if not booted:
+        notes.append("not running under systemd; systemd integration and journal unavailable")
+    elif not systemd_ok:
         notes.append("systemctl not found; systemd integration limited")
     if not sysfs_ok:
         notes.append("/sys/block not accessible")
     if zswap.available and zswap.enabled:
         notes.append("zswap is enabled; may conflict with zram writeback policies")
-    if not journal_ok:
+    if booted and not journal_ok:
         notes.append(
             "journal access not available (python3-systemd or journalctl missing)"
         )
@@ -133,7 +158,7 @@ def check_system_health() -> HealthReport:
         journal_available=journal_ok,
         kernel_version=kernel_version,
         devices_summary=_devices_summary(),
-        notes=notes,
+        notes=tuple(notes),
     )
 
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 from core.utils.common import run, SystemCommandError, read_file
 from core.utils.block import is_block_device
 from core.utils.swap import detect_resume_swap
-from core.utils.zram_stats import scan_zram_devices, get_zram_props
+from core.utils.zram_stats import scan_zram_devices, get_zram_props, build_mountpoint_index
 from .types import HibernateCheckResult
 
 
@@ -43,9 +43,11 @@ def get_recommended_swap_size() -> int:
     zram_total = 0
     
     # Sum the virtual size of all active ZRAM devices
-    for dev in scan_zram_devices():
+    devices = scan_zram_devices()
+    mount_index = build_mountpoint_index() if devices else {}
+    for dev in devices:
         try:
-            props = get_zram_props(dev)
+            props = get_zram_props(dev, mount_index)
             ds = props.get("disksize", "-")
             if ds != "-":
                 from core.utils.units import parse_size_to_bytes
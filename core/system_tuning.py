@@ -6,39 +6,61 @@ Handles privileged writes to /sys and /proc for kernel parameters.
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Collection, Optional
 
-from core.utils.common import read_file
-from core.utils.io import pkexec_write
+from core.utils.common import read_file, invalidate_file_ttl
+from core.utils.io import pkexec_write, is_root
 
 _LOGGER = logging.getLogger(__name__)
 
-def set_cpu_governor(governor: str, available_governors: List[str]) -> bool:
+def _write_sysfs_direct(path: Path, value: str) -> tuple[bool, str | None]:
+    """
+    Writes a sysfs or procfs attribute in place with a single os.write().
+    Only for root: these nodes cannot be swapped in by rename, so the
+    atomic-write path behind pkexec_write is not usable here.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY)
+    except OSError as e:
+        return False, str(e)
+    try:
+        os.write(fd, value.encode())
+        return True, None
+    except OSError as e:
+        return False, str(e)
+    finally:
+        os.close(fd)
+
+def set_cpu_governor(governor: str, available_governors: Collection[str]) -> bool:
     """Sets the CPU governor for all online CPU cores via pkexec."""
     if governor not in available_governors:
         _LOGGER.error(f"Governor '{governor}' is not available.")
         return False
 
     cpu_glob_path = Path("/sys/devices/system/cpu/")
-    success_count = 0
-    total_count = 0
+    gov_paths = list(cpu_glob_path.glob("cpu*/cpufreq/scaling_governor"))
+    if not gov_paths:
+        _LOGGER.error("Could not find any CPU governor files in /sys.")
+        return False
+
+    # Reading is unprivileged: skip the write for cores already set
+    pending = [p for p in gov_paths if read_file(p) != governor]
+    write = _write_sysfs_direct if is_root() else pkexec_write
 
-    for gov_path in cpu_glob_path.glob("cpu*/cpufreq/scaling_governor"):
-        total_count += 1
-        success, err = pkexec_write(gov_path, governor)
+    success_count = len(gov_paths) - len(pending)
+    for gov_path in pending:
+        success, err = write(gov_path, governor)
+        invalidate_file_ttl(gov_path)
         if success:
             success_count += 1
         else:
             _LOGGER.warning(f"Failed to set governor for {gov_path.parent.parent.name}: {err}")
 
-    if total_count == 0:
-        _LOGGER.error("Could not find any CPU governor files in /sys.")
-        return False
+    return success_count == len(gov_paths)
 
-    return success_count == total_count
-
-def set_io_scheduler(device_name: str, scheduler: str, available_schedulers: List[str]) -> bool:
+def set_io_scheduler(device_name: str, scheduler: str, available_schedulers: Collection[str]) -> bool:
     """Sets the I/O scheduler for a given block device via pkexec."""
     if not device_name or not device_name.strip():
         return False
@@ -48,7 +70,11 @@ def set_io_scheduler(device_name: str, scheduler: str, available_schedulers: Lis
         return False
 
     path = Path(f"/sys/block/{device_name}/queue/scheduler")
-    success, err = pkexec_write(path, scheduler)
+    if f"[{scheduler}]" in (read_file(path) or "").split():
+        return True
+
+    write = _write_sysfs_direct if is_root() else pkexec_write
+    success, err = write(path, scheduler)
     if not success:
         _LOGGER.error(f"Failed to set I/O scheduler for {device_name}: {err}")
     return success
@@ -60,7 +86,8 @@ def set_vfs_cache_pressure(value: int) -> bool:
         return False
     
     path = Path("/proc/sys/vm/vfs_cache_pressure")
-    success, err = pkexec_write(path, str(value))
+    write = _write_sysfs_direct if is_root() else pkexec_write
+    success, err = write(path, str(value))
     if not success:
         _LOGGER.error(f"Failed to set vfs_cache_pressure: {err}")
     return success
@@ -7,6 +7,7 @@ from __future__ import annotations
 import os
 import json
 import logging
+import stat
 from pathlib import Path
 from typing import Any
 from .common import run
@@ -17,10 +18,11 @@ _LOGGER = logging.getLogger(__name__)
 
 def is_block_device(path: str | Path) -> bool:
     """Determine if a path is a block device."""
-    p = Path(path)
+    # One stat() instead of exists() + stat(); symlinks are followed on purpose
+    # so /dev/disk/by-uuid/... and /dev/mapper/... links resolve to their device.
     try:
-        return p.exists() and p.stat().st_mode & 0o170000 == 0o060000
-    except Exception:
+        return stat.S_ISBLK(os.stat(path).st_mode)
+    except (OSError, ValueError):
         return False
 
 
@@ -4,8 +4,13 @@ Base utility layer: execution and command handling.
 """
 from __future__ import annotations
 
+import functools
+import os
+import shutil
 import subprocess
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from typing import Iterator
 from pathlib import Path
@@ -32,22 +37,145 @@ class ValidationError(ValueError):
 class NotBlockDeviceError(ValidationError):
     pass
 
+@functools.lru_cache(maxsize=64)
+def _which(name: str) -> str:
+    return shutil.which(name) or name
+
+def _spawn_argv(cmd: list[str]) -> list[str]:
+    """
+    Resolves argv[0] to an absolute path once per binary. With an absolute path and
+    close_fds=False, subprocess takes its posix_spawn() fast path instead of fork+exec.
+    """
+    if cmd and "/" not in cmd[0]:
+        return [_which(cmd[0]), *cmd[1:]]
+    return cmd
+
+# close_fds=False below is safe: Python creates fds non-inheritable (PEP 446), and we
+# only run trusted binaries with list-form argv, never through a shell.
+
 def run(cmd: list[str], check: bool = False, env: dict[str, str] | None = None) -> CmdResult:
     """Run a command and capture stdout/stderr."""
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
+    proc = subprocess.run(
+        _spawn_argv(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env, close_fds=False
+    )
     res = CmdResult(code=proc.returncode, out=proc.stdout, err=proc.stderr)
     if check and proc.returncode != 0:
         raise SystemCommandError(cmd, proc.returncode, proc.stdout, proc.stderr)
     return res
 
+def run_status(cmd: list[str]) -> int:
+    """Run a command for its exit status only; output goes to /dev/null and is never decoded."""
+    return subprocess.call(_spawn_argv(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+
 def read_file(path: str | Path) -> str | None:
-    """Safely reads a sysfs or config file with broad exception handling."""
-    p = Path(path)
+    """
+    Safely reads a sysfs or config file with broad exception handling.
+    Uses raw os.read() so no BufferedReader/TextIOWrapper is built for what is
+    usually a few bytes of sysfs; newlines are normalized as read_text() would.
+    """
     try:
-        return p.read_text(encoding="utf-8").strip()
+        fd = os.open(path, os.O_RDONLY)
     except Exception:
         # Broad catch to match monolith's resilience against I/O or permission issues
         return None
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        text = b"".join(chunks).decode("utf-8")
+    except Exception:
+        return None
+    finally:
+        os.close(fd)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
+
+# path -> (expires_at, value) for read_file_ttl()
+_TTL_CACHE: dict[str, tuple[float, str | None]] = {}
+
+def read_file_ttl(path: str | Path, ttl: float = 1.0) -> str | None:
+    """
+    read_file() with a short time-based cache, for sysfs nodes that rarely change
+    but are polled on every refresh. ttl=0 always reads and stores nothing.
+    """
+    key = str(path)
+    now = time.monotonic()
+    hit = _TTL_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    value = read_file(path)
+    if ttl > 0:
+        _TTL_CACHE[key] = (now + ttl, value)
+    return value
+
+def invalidate_file_ttl(path: str | Path | None = None) -> None:
+    """Drops one cached read_file_ttl() entry, or all of them; call after writing the node."""
+    if path is None:
+        _TTL_CACHE.clear()
+    else:
+        _TTL_CACHE.pop(str(path), None)
+
+def read_proc_small(path: str | Path, size: int = 4096) -> str | None:
+    """Reads a small fixed-format /proc or /sys file with one os.read(), bypassing the io stack."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, size).decode("ascii", "ignore").strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+# Open fds for sysfs attributes that are polled every telemetry tick.
+# Guarded by a lock so a fd is never closed (and its number reused) mid-read.
+_SYSFS_FDS: dict[str, int] = {}
+_SYSFS_FDS_LOCK = threading.Lock()
+_SYSFS_FDS_MAX = 256
+
+def read_sysfs_cached(path: str | Path, size: int = 4096) -> str | None:
+    """
+    Reads a frequently polled sysfs attribute with pread() at offset 0 on a kept-open fd,
+    so repeat reads cost one syscall instead of open/read/close. A fd whose device
+    went away fails with ENODEV and is reopened once.
+    """
+    key = str(path)
+    with _SYSFS_FDS_LOCK:
+        fd = _SYSFS_FDS.get(key)
+        if fd is not None:
+            try:
+                return os.pread(fd, size, 0).decode("ascii", "ignore").strip()
+            except OSError:
+                del _SYSFS_FDS[key]
+                os.close(fd)
+        try:
+            fd = os.open(key, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            data = os.pread(fd, size, 0)
+        except OSError:
+            os.close(fd)
+            return None
+        if len(_SYSFS_FDS) >= _SYSFS_FDS_MAX:
+            _close_sysfs_fds_locked()
+        _SYSFS_FDS[key] = fd
+        return data.decode("ascii", "ignore").strip()
+
+def _close_sysfs_fds_locked() -> None:
+    for fd in _SYSFS_FDS.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _SYSFS_FDS.clear()
+
+def close_sysfs_fds() -> None:
+    """Closes every fd kept open by read_sysfs_cached()."""
+    with _SYSFS_FDS_LOCK:
+        _close_sysfs_fds_locked()
 
 def stream_command(cmd: list[str], env: dict[str, str] | None = None, input_text: str | None = None) -> Iterator[str]:
     """Run a command and yield its stdout line by line."""
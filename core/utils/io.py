@@ -3,23 +3,39 @@
 Filesystem and privileged writing utilities.
 """
 from __future__ import annotations
+import functools
 import os
 import shutil
 import tempfile
 import subprocess
 from pathlib import Path
 
+@functools.lru_cache(maxsize=1)
 def is_root() -> bool:
-    """Check if process has root privileges."""
+    """Check if process has root privileges. The euid is fixed for our lifetime, so it is cached."""
     return os.geteuid() == 0
 
-def atomic_write_to_file(file_path: str | Path, content: str, backup: bool = False) -> tuple[bool, str | None]:
-    """Safely writes content to a file using atomic move."""
+def _fsync_dir(dir_path: Path) -> None:
+    """Flush a directory entry so a completed rename survives a crash."""
+    dfd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
+
+def atomic_write_to_file(file_path: str | Path, content: str | bytes, backup: bool = False, fsync: bool = False) -> tuple[bool, str | None]:
+    """
+    Safely writes content to a file using atomic move.
+    With fsync=True the data and the directory entry are flushed before
+    returning, for files that must survive a crash right after the write.
+    Text is encoded as UTF-8 once; pre-encoded bytes are written as-is.
+    """
     path = Path(file_path)
+    data = content if isinstance(content, bytes) else content.encode("utf-8")
     try:
         if path.exists():
             try:
-                if path.read_text(encoding="utf-8") == content:
+                if path.read_bytes() == data:
                     return True, None
             except Exception:
                 pass
@@ -27,11 +43,22 @@ def atomic_write_to_file(file_path: str | Path, content: str, backup: bool = Fal
                 shutil.copy2(path, path.with_suffix(f"{path.suffix}.bak"))
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        fd, temp_path = tempfile.mkstemp(dir=path.parent, text=True)
-        with os.fdopen(fd, 'w') as f:
-            f.write(content)
-        shutil.move(temp_path, path)
-        path.chmod(0o644)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent)
+        try:
+            # mkstemp creates 0600; fix the mode on the fd so the target never has it
+            os.fchmod(fd, 0o644)
+            # Raw writes on the fd: config files are small, no buffered text layer needed
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Same directory as the target, so a plain rename is atomic
+        os.replace(temp_path, path)
+        if fsync:
+            _fsync_dir(path.parent)
         return True, None
     except Exception as e:
         return False, f"Z-Manager System Error: {e}"
@@ -44,20 +71,23 @@ def _get_helper_path() -> str:
     """Path to zman-helper script."""
     return str(Path(__file__).parent.parent / "zman_helper.py")
 
-def pkexec_write(file_path: str | Path, content: str) -> tuple[bool, str | None]:
-    """Write to a protected file via pkexec."""
+def pkexec_write(file_path: str | Path, content: str | bytes, fsync: bool = False) -> tuple[bool, str | None]:
+    """
+    Write to a protected file via pkexec.
+    fsync only applies when already root; zman-helper's own write never flushes.
+    """
     if is_root():
-        return atomic_write_to_file(file_path, content, backup=True)
+        return atomic_write_to_file(file_path, content, backup=True, fsync=fsync)
     
     try:
         proc = subprocess.run(
             ["pkexec", _get_helper_path(), "write", str(file_path)],
-            input=content,
-            text=True,
+            input=content if isinstance(content, bytes) else content.encode("utf-8"),
             capture_output=True
         )
         if proc.returncode == 0:
             return True, None
-        return False, proc.stderr.strip() or f"pkexec write failed (code {proc.returncode})"
+        stderr = proc.stderr.decode("utf-8", "replace").strip()
+        return False, stderr or f"pkexec write failed (code {proc.returncode})"
     except Exception as e:
         return False, f"Z-Manager System Error: {e}"
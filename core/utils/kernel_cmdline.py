@@ -5,12 +5,24 @@ Kernel command-line parsing utilities.
 
 from __future__ import annotations
 
+import functools
 import logging
-from .common import read_file
+from .common import read_proc_small
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _cmdline_tokens() -> frozenset[str]:
+    """Read and split /proc/cmdline once; it cannot change until reboot."""
+    try:
+        cmdline = read_proc_small("/proc/cmdline")
+        return frozenset(cmdline.split()) if cmdline else frozenset()
+    except Exception as e:
+        _LOGGER.warning(f"Could not read /proc/cmdline: {e}")
+        return frozenset()
+
+
 def is_kernel_param_active(param: str) -> bool:
     """Check the live kernel command line for a given parameter.
 
@@ -18,11 +30,5 @@ def is_kernel_param_active(param: str) -> bool:
     exact tokens (``zswap.enabled=0``) and prefix patterns (``resume=``)
     work correctly.
     """
-    try:
-        cmdline = read_file("/proc/cmdline")
-        if not cmdline:
-            return False
-        return any(token.startswith(param) for token in cmdline.split())
-    except Exception as e:
-        _LOGGER.warning(f"Could not read /proc/cmdline: {e}")
-        return False
+    tokens = _cmdline_tokens()
+    return param in tokens or any(token.startswith(param) for token in tokens)
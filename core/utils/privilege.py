@@ -5,7 +5,7 @@ Privileged orchestration via pkexec.
 from __future__ import annotations
 import subprocess
 from pathlib import Path
-from .common import run, SystemCommandError
+from .common import run, run_status, SystemCommandError
 from .io import is_root, _get_helper_path
 
 def systemd_daemon_reload() -> None:
@@ -106,13 +106,21 @@ def pkexec_hibernate_policy() -> tuple[bool, str]:
 
 def systemd_try_restart(service: str) -> tuple[bool, str | None]:
     """Attempts to restart a service using standard run() first, then pkexec."""
-    res = run(["systemctl", "restart", service])
-    if res.code == 0:
+    if run_status(["systemctl", "restart", service]) == 0:
         return True, None
     
     # If standard restart fails, try with pkexec escalation
     return pkexec_systemctl("restart", service)
 
+def systemd_restart_if_active(service: str) -> tuple[bool, str | None]:
+    """
+    systemctl try-restart: systemd itself skips units that are not running, so
+    there is no check-then-restart race. Like restart, it waits for the job.
+    """
+    if run_status(["systemctl", "try-restart", service]) == 0:
+        return True, None
+    return pkexec_systemctl("try-restart", service)
+
 def pkexec_sysctl_system() -> tuple[bool, str | None]:
     """sysctl --system via pkexec."""
     if is_root():
@@ -131,6 +139,20 @@ def pkexec_sysctl_system() -> tuple[bool, str | None]:
     except Exception as e:
         return False, f"Z-Manager Orchestration Error: {e}"
 
+def pkexec_sysctl_load(path: str) -> tuple[bool, str | None]:
+    """
+    sysctl -p <path>: loads a single drop-in instead of every sysctl.d directory.
+    The pkexec helper only exposes a full reload, so unprivileged callers get that.
+    """
+    if not is_root():
+        return pkexec_sysctl_system()
+    try:
+        run(["sysctl", "-p", path], check=True)
+        return True, None
+    except SystemCommandError as e:
+        return False, str(e)
+
+
 
 import json
 
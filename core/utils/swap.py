@@ -10,10 +10,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .common import run, SystemCommandError, read_file
+from .common import read_file
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwapDevice:
     """Represents a single entry from /proc/swaps."""
 
@@ -32,26 +32,24 @@ def get_all_swaps() -> list[SwapDevice]:
     if not content:
         return []
 
-    lines = content.strip().splitlines()
-    if len(lines) <= 1:
-        return []
-
+    # read_file() already stripped the text; the first line is the column header.
     swaps = []
-    for line in lines[1:]:
-        parts = line.split()
-        if len(parts) >= 5 and parts[2].isdigit():
-            try:
-                swaps.append(
-                    SwapDevice(
-                        name=parts[0],
-                        type=parts[1],
-                        size_kb=int(parts[2]),
-                        used_kb=int(parts[3]),
-                        priority=int(parts[4]),
-                    )
+    for line in content.splitlines()[1:]:
+        parts = line.split(None, 4)
+        if len(parts) < 5:
+            continue
+        try:
+            swaps.append(
+                SwapDevice(
+                    name=parts[0],
+                    type=parts[1],
+                    size_kb=int(parts[2]),
+                    used_kb=int(parts[3]),
+                    priority=int(parts[4]),
                 )
-            except (ValueError, IndexError):
-                continue
+            )
+        except ValueError:
+            continue
     return swaps
 
 
@@ -71,13 +69,13 @@ def is_device_active(device_path: str) -> bool:
 
 def is_device_in_swaps(device_name: str) -> bool:
     """Checks if a device name is currently used as swap."""
-    try:
-        swaps = run(["cat", "/proc/swaps"]).out
-        if f"/dev/{device_name}" in swaps:
-            return True
-    except (SystemCommandError, OSError):
-        pass
-    return False
+    content = read_file("/proc/swaps")
+    if not content:
+        return False
+    target = f"/dev/{device_name}"
+    return any(
+        line.split(maxsplit=1)[0] == target for line in content.splitlines()[1:] if line
+    )
 
 
 def detect_resume_swap() -> Optional[str]:
@@ -3,66 +3,69 @@
 Data units and conversion utilities.
 """
 from __future__ import annotations
-import re
-import math
+import functools
+
+# Binary units in order; a unit's index i means a multiplier of 1 << (10 * i)
+_UNITS = "BKMGTP"
 
 def bytes_to_human(size_bytes: int) -> str:
     """Convert bytes to human-readable format matching zramctl output."""
     if size_bytes <= 0:
         return "0B"
     
-    units = ("B", "K", "M", "G", "T", "P")
-    i = min(int(math.log(size_bytes, 1024)), len(units) - 1)
-    size = size_bytes / pow(1024, i)
-    
-    return f"{int(size) if size.is_integer() else round(size, 1)}{units[i]}"
+    # Each unit step is 2**10, so the bit length picks it without a float log
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    size = size_bytes / (1 << (10 * i))
+
+    return f"{int(size) if size.is_integer() else round(size, 1)}{_UNITS[i]}"
 
 def parse_size_to_bytes(size_str: str) -> int:
     """
     Converts a size string like '4G', '512M', '1GiB' to bytes.
     Handles B, K, M, G, T, P suffixes (and their iB/B variants).
     """
-    if not isinstance(size_str, str) or not (s := size_str.strip().upper()):
+    if not isinstance(size_str, str):
         return 0
+    return _parse_size_cached(size_str)
 
-    # Match number and optional unit (e.g., 4G, 4GiB, 4GB)
-    if not (match := re.match(r"^(\d+(?:\.\d+)?)\s*([A-Z]+)?$", s)):
+@functools.lru_cache(maxsize=1024)
+def _parse_size_cached(size_str: str) -> int:
+    # Telemetry re-parses the same few size strings every refresh
+    if not (s := size_str.strip().upper()):
         return 0
-    
-    number_str, unit_str = match.groups()
-    try:
-        value = float(number_str)
-    except ValueError:
+
+    # Split "<digits>[.<digits>] <LETTERS>" by hand (e.g., 4G, 4GiB, 4GB, 1.5 M)
+    i = 0
+    while i < len(s) and (s[i] == "." or s[i].isdecimal()):
+        i += 1
+    number_str, unit_str = s[:i], s[i:].lstrip()
+
+    whole, _, frac = number_str.partition(".")
+    if not whole.isdecimal() or ("." in number_str and not frac.isdecimal()):
+        return 0
+    if unit_str and not (unit_str.isascii() and unit_str.isalpha()):
         return 0
-        
+
+    value = float(number_str)
     if not unit_str:
         return int(value)
 
-    # Normalize unit: K, KB, KIB -> K
-    unit = unit_str[0]
-    multipliers = {
-        'B': 1,
-        'K': 1024,
-        'M': 1024**2,
-        'G': 1024**3,
-        'T': 1024**4,
-        'P': 1024**5
-    }
-    
-    if unit not in multipliers:
+    # Normalize unit: K, KB, KIB -> K; its position in _UNITS gives the shift
+    if (i := _UNITS.find(unit_str[0])) < 0:
         return 0
-        
-    return int(value * multipliers[unit])
+
+    return int(value * (1 << (10 * i)))
 
 def calculate_compression_ratio(data_size_str: str | None, compr_size_str: str | None) -> float | None:
     """Calculates compression ratio from human-readable strings."""
     if not data_size_str or not compr_size_str or "-" in (data_size_str, compr_size_str):
         return None
     
-    data_bytes = parse_size_to_bytes(data_size_str)
-    compr_bytes = parse_size_to_bytes(compr_size_str)
-    
+    return compression_ratio(parse_size_to_bytes(data_size_str), parse_size_to_bytes(compr_size_str))
+
+def compression_ratio(data_bytes: int, compr_bytes: int) -> float | None:
+    """Calculates compression ratio from raw byte counts (e.g. mm_stat columns)."""
     if compr_bytes == 0:
         return None if data_bytes == 0 else float('inf')
-    
+
     return round(data_bytes / compr_bytes, 2)
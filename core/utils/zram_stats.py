@@ -5,33 +5,49 @@ ZRAM-specific sysfs parsing and status reporting.
 from __future__ import annotations
 import logging
 import os
-import re
+import threading
+import time
 from pathlib import Path
 from typing import Any
-from .common import read_file
-from .units import bytes_to_human, calculate_compression_ratio
+from .common import read_sysfs_cached
+from .units import bytes_to_human, compression_ratio
 
 _LOGGER = logging.getLogger(__name__)
 
+# parse_zramctl_table() snapshot, reused across bursts of UI/telemetry polls.
+# The generation counter stops a scan that raced an invalidation from being stored.
+_TABLE_TTL = 0.25
+_TABLE_LOCK = threading.Lock()
+_TABLE_CACHE: tuple[float, list[dict[str, Any]]] | None = None
+_TABLE_GEN = 0
+
+def invalidate_zram_cache() -> None:
+    """Drops the cached device table; call after changing a zram device."""
+    global _TABLE_CACHE, _TABLE_GEN
+    with _TABLE_LOCK:
+        _TABLE_CACHE = None
+        _TABLE_GEN += 1
+
 def scan_zram_devices() -> list[str]:
     """Find all zram device names in sysfs."""
-    sys_block = Path("/sys/block")
-    if not sys_block.exists(): return []
+    # /sys/block entries are symlinks into /sys/devices; the name alone identifies
+    # a zram disk, so no per-entry stat is needed. A missing /sys/block raises here.
     try:
-        devs = [e.name for e in sys_block.iterdir() if e.is_dir() and e.name.startswith("zram")]
-        devs.sort(key=lambda x: int(x[4:]) if x[4:].isdigit() else 0)
-        return devs
-    except Exception:
+        with os.scandir("/sys/block") as it:
+            devs = [e.name for e in it if e.name.startswith("zram") and e.name[4:].isdigit()]
+    except OSError:
         return []
+    devs.sort(key=lambda x: int(x[4:]))
+    return devs
 
 def zram_sysfs_dir(device_name: str) -> str:
     """Returns sysfs path for a zram device."""
     return f"/sys/block/{device_name}"
 def sysfs_reset_device(device_path: str) -> None:
     """Resets a zram device via sysfs."""
-    import os
     device_name = os.path.basename(device_path)
     reset_path = Path(f"/sys/block/{device_name}/reset")
+    invalidate_zram_cache()
     try:
         reset_path.write_text("1", encoding="utf-8")
     except (IOError, OSError) as e:
@@ -39,42 +55,61 @@ def sysfs_reset_device(device_path: str) -> None:
         raise RuntimeError(f"Z-Manager Error: Failed to reset zram device via {reset_path}. System Error: {e}") from e
 
 
-def get_zram_mountpoint(device_name: str) -> str:
-    """Check if zram is used as swap or mounted."""
-    dev_path = f"/dev/{device_name}"
+def build_mountpoint_index() -> dict[str, str]:
+    """
+    Reads /proc/swaps and /proc/mounts once and maps each zram device to
+    "[SWAP]" or its mountpoint. Swap wins over a mount of the same device.
+    """
+    index: dict[str, str] = {}
     for f in ("/proc/swaps", "/proc/mounts"):
         try:
             content = Path(f).read_text(encoding="utf-8")
-            if dev_path in content:
-                if f == "/proc/swaps": return "[SWAP]"
-                for line in content.splitlines():
-                    if line.startswith(dev_path):
-                        return line.split()[1]
         except Exception:
-            pass
-    return ""
+            continue
+        for line in content.splitlines():
+            # Most mounts are not zram; skip them before paying for a split()
+            if not line.startswith("/dev/zram"):
+                continue
+            parts = line.split(None, 2)
+            if f == "/proc/swaps":
+                index[parts[0]] = "[SWAP]"
+            elif len(parts) >= 2:
+                index.setdefault(parts[0], parts[1])
+    return index
+
+def get_zram_mountpoint(device_name: str, mount_index: dict[str, str] | None = None) -> str:
+    """
+    Check if zram is used as swap or mounted.
+    Pass a build_mountpoint_index() result when scanning several devices so
+    the /proc tables are read once per pass instead of once per device.
+    """
+    if mount_index is None:
+        mount_index = build_mountpoint_index()
+    return mount_index.get(f"/dev/{device_name}", "")
 
-def get_zram_props(device_name: str) -> dict[str, Any]:
+def get_zram_props(device_name: str, mount_index: dict[str, str] | None = None) -> dict[str, Any]:
     """
     Read all properties for a zram device. 
     Restores full parity with the monolith (Legacy Fallbacks & Writeback).
     """
-    base = Path(f"/sys/block/{device_name}")
+    base = f"/sys/block/{device_name}"
     props = {"name": device_name}
     
     # Disksize
-    ds = read_file(base / "disksize")
+    ds = read_sysfs_cached(f"{base}/disksize")
     props["disksize"] = bytes_to_human(int(ds)) if ds and ds != "0" else "-"
     
     # 1. MM Stat (Modern kernels: 7+ columns)
-    ms = read_file(base / "mm_stat")
+    ms = read_sysfs_cached(f"{base}/mm_stat")
     if ms:
         p = ms.split()
         if len(p) >= 3:
-            props["data-size"] = bytes_to_human(int(p[0]))
-            props["compr-size"] = bytes_to_human(int(p[1]))
+            data, compr = int(p[0]), int(p[1])
+            props["data-size"] = bytes_to_human(data)
+            props["compr-size"] = bytes_to_human(compr)
             props["total-size"] = bytes_to_human(int(p[2]))
-            props["ratio"] = calculate_compression_ratio(props["data-size"], props["compr-size"])
+            # Ratio from the raw counters, not by re-parsing the rounded human strings
+            props["ratio"] = compression_ratio(data, compr)
         
         if len(p) >= 7:
             props["mem-limit"] = bytes_to_human(int(p[3]))
@@ -82,14 +117,14 @@ def get_zram_props(device_name: str) -> dict[str, Any]:
             props["same-pages"] = p[5] # Count, not size
     else:
         # 2. Legacy Fallback (Older kernels)
-        orig = read_file(base / "orig_data_size")
-        compr = read_file(base / "compr_data_size")
-        total = read_file(base / "mem_used_total")
+        orig = read_sysfs_cached(f"{base}/orig_data_size")
+        compr = read_sysfs_cached(f"{base}/compr_data_size")
+        total = read_sysfs_cached(f"{base}/mem_used_total")
         
         props["data-size"] = bytes_to_human(int(orig)) if orig else "-"
         props["compr-size"] = bytes_to_human(int(compr)) if compr else "-"
         props["total-size"] = bytes_to_human(int(total)) if total else "-"
-        props["ratio"] = calculate_compression_ratio(props["data-size"], props["compr-size"])
+        props["ratio"] = compression_ratio(int(orig), int(compr)) if orig and compr else None
         
         # Extended fields usually unavailable in legacy, use defaults
         props.setdefault("mem-limit", "-")
@@ -97,7 +132,7 @@ def get_zram_props(device_name: str) -> dict[str, Any]:
         props.setdefault("same-pages", "-")
 
     # 3. Writeback (Migrated) Stats
-    bd = read_file(base / "bd_stat")
+    bd = read_sysfs_cached(f"{base}/bd_stat")
     if bd:
         p = bd.split()
         if len(p) >= 3:
@@ -107,25 +142,50 @@ def get_zram_props(device_name: str) -> dict[str, Any]:
         props["migrated"] = "0B"
     
     # 4. Compression Algorithm
-    algo = read_file(base / "comp_algorithm")
+    algo = read_sysfs_cached(f"{base}/comp_algorithm")
     if algo:
-        m = re.search(r'\[([^\]]+)\]', algo)
-        props["algorithm"] = m.group(1) if m else algo.split()[0]
+        # sysfs marks the active algorithm as "lzo [zstd] lz4"; slice it out directly
+        start = algo.find("[") + 1
+        end = algo.find("]", start)
+        props["algorithm"] = algo[start:end] if start and end > start else algo.split()[0]
     else:
         props["algorithm"] = None
         
-    props["mountpoint"] = get_zram_mountpoint(device_name)
+    props["mountpoint"] = get_zram_mountpoint(device_name, mount_index)
     return props
 
 def parse_zramctl_table() -> list[dict[str, Any]]:
-    """Backward compatibility wrapper for zram device list."""
+    """
+    Backward compatibility wrapper for zram device list.
+    A snapshot is reused for _TABLE_TTL seconds; changes made through this
+    package call invalidate_zram_cache() so they show up immediately.
+    """
+    global _TABLE_CACHE
+    with _TABLE_LOCK:
+        cached, gen = _TABLE_CACHE, _TABLE_GEN
+    if cached is not None and time.monotonic() - cached[0] < _TABLE_TTL:
+        return [dict(p) for p in cached[1]]
+
+    started = time.monotonic()
+    results = _scan_zram_table()
+    with _TABLE_LOCK:
+        if gen == _TABLE_GEN:
+            _TABLE_CACHE = (started, results)
+    return [dict(p) for p in results]
+
+def _scan_zram_table() -> list[dict[str, Any]]:
     results = []
-    for dev in scan_zram_devices():
+    devices = scan_zram_devices()
+    if not devices:
+        # zram unloaded or no devices: skip reading /proc/swaps and /proc/mounts
+        return results
+    mount_index = build_mountpoint_index()
+    for dev in devices:
         try:
-            props = get_zram_props(dev)
+            props = get_zram_props(dev, mount_index)
             if props.get("disksize") != "-":
                 results.append(props)
         except (IOError, OSError):
-            _LOGGER.debug(f"Skipping device {dev} due to probe error (likely disappeared)")
+            _LOGGER.debug("Skipping device %s due to probe error (likely disappeared)", dev)
             continue
     return results
@@ -64,9 +64,9 @@ def _atomic_write(path: str, content: str) -> bool:
         fd, temp_path = tempfile.mkstemp(dir=dir_name or ".", text=True)
         try:
             with os.fdopen(fd, 'w') as f:
+                os.fchmod(f.fileno(), 0o644)
                 f.write(content)
-            shutil.move(temp_path, path)
-            os.chmod(path, 0o644)
+            os.replace(temp_path, path)
         except Exception:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 
 from core.utils.common import run
 
@@ -50,12 +50,76 @@ def _format_ts_safe(value: Any) -> datetime:
         return datetime.now().astimezone()
 
 
-def list_zram_logs(
+def _record_from_entry(entry: Dict[str, Any]) -> JournalRecord:
+    ts = entry.get("__REALTIME_TIMESTAMP", datetime.now().astimezone())
+    msg = entry.get("MESSAGE", "No message found.")
+    prio = entry.get("PRIORITY", 6)
+    return JournalRecord(
+        timestamp=_format_ts_safe(ts),
+        priority=int(prio)
+        if isinstance(prio, (int, str)) and str(prio).isdigit()
+        else 6,
+        message=str(msg),
+        fields={k: v for k, v in entry.items() if isinstance(k, str)},
+    )
+
+
+def _iter_journalctl_logs(unit: str, count: int) -> Iterator[JournalRecord]:
+    from core.utils.privilege import pkexec_read_journal
+
+    cmd = [
+        "journalctl",
+        "--system",
+        "-u",
+        unit,
+        "-n",
+        str(count),
+        "--no-pager",
+        "--output=short-iso",
+    ]
+    jr = run(cmd, check=False)
+
+    # If journalctl fails, try with pkexec
+    out_text = jr.out
+    if jr.code != 0:
+        success, pkexec_out = pkexec_read_journal(unit, count)
+        if success and pkexec_out:
+            out_text = pkexec_out
+        else:
+            # If both fail, return empty or error message
+            out_text = pkexec_out or jr.err or ""
+
+    for ln in out_text.splitlines():
+        if not ln.strip():
+            continue
+        ts: datetime = datetime.now().astimezone()
+        msg = ln
+        prio = 6
+        try:
+            first_space = ln.find(" ")
+            if first_space > 0:
+                ts_str = ln[:first_space]
+                ts = _parse_iso_best_effort(ts_str) or datetime.now().astimezone()
+                msg = ln[first_space + 1 :].strip()
+        except Exception:
+            pass
+        yield JournalRecord(
+            timestamp=ts,
+            priority=prio,
+            message=msg,
+            fields={"source": "journalctl"},
+        )
+
+
+def iter_zram_logs(
     unit: str = "systemd-zram-setup@zram0.service", count: int = 25
-) -> List[JournalRecord]:
+) -> Iterator[JournalRecord]:
     """
-    Return latest ZRAM-related logs as normalized records.
-    Prefers python3-systemd if available; otherwise falls back to `journalctl`.
+    Yield the latest ZRAM-related logs oldest-first, one record at a time.
+    With python3-systemd the reader steps back `count` entries from the tail and
+    then walks forward, so nothing is buffered; otherwise falls back to `journalctl`.
+    A reader error before the first record also falls back; after that the
+    stream just ends, since journalctl would repeat what was already yielded.
     """
     try:
         import systemd.journal  # type: ignore
@@ -63,72 +127,32 @@ def list_zram_logs(
         reader = systemd.journal.Reader()
         reader.add_match(_SYSTEMD_UNIT=unit)
         reader.seek_tail()
-        buf: List[JournalRecord] = []
-        i = 0
-        while i < count and (entry := reader.get_previous()):
-            i += 1
-            ts = entry.get("__REALTIME_TIMESTAMP", datetime.now().astimezone())
-            msg = entry.get("MESSAGE", "No message found.")
-            prio = entry.get("PRIORITY", 6)
-            rec = JournalRecord(
-                timestamp=_format_ts_safe(ts),
-                priority=int(prio)
-                if isinstance(prio, (int, str)) and str(prio).isdigit()
-                else 6,
-                message=str(msg),
-                fields={k: v for k, v in entry.items() if isinstance(k, str)},
-            )
-            buf.append(rec)
-        buf.reverse()
-        return buf
+        entry = reader.get_previous(count) if count > 0 else None
     except (ImportError, Exception):
-        from core.utils.privilege import pkexec_read_journal
-        
-        cmd = [
-            "journalctl",
-            "--system",
-            "-u",
-            unit,
-            "-n",
-            str(count),
-            "--no-pager",
-            "--output=short-iso",
-        ]
-        jr = run(cmd, check=False)
-        
-        # If journalctl fails, try with pkexec
-        out_text = jr.out
-        if jr.code != 0:
-            success, pkexec_out = pkexec_read_journal(unit, count)
-            if success and pkexec_out:
-                out_text = pkexec_out
-            else:
-                # If both fail, return empty or error message
-                out_text = pkexec_out or jr.err or ""
-
-        lines = [ln for ln in out_text.splitlines() if ln.strip()]
-        records: List[JournalRecord] = []
-        for ln in lines:
-            ts: datetime = datetime.now().astimezone()
-            msg = ln
-            prio = 6
-            try:
-                first_space = ln.find(" ")
-                if first_space > 0:
-                    ts_str = ln[:first_space]
-                    ts = _parse_iso_best_effort(ts_str) or datetime.now().astimezone()
-                    msg = ln[first_space + 1 :].strip()
-            except Exception:
-                pass
-            records.append(
-                JournalRecord(
-                    timestamp=ts,
-                    priority=prio,
-                    message=msg,
-                    fields={"source": "journalctl"},
-                )
-            )
-        return records
+        yield from _iter_journalctl_logs(unit, count)
+        return
+
+    emitted = False
+    try:
+        while entry:
+            record = _record_from_entry(entry)
+            emitted = True
+            yield record
+            entry = reader.get_next()
+    except Exception:
+        if emitted:
+            return
+        yield from _iter_journalctl_logs(unit, count)
+
+
+def list_zram_logs(
+    unit: str = "systemd-zram-setup@zram0.service", count: int = 25
+) -> List[JournalRecord]:
+    """
+    Return latest ZRAM-related logs as normalized records.
+    Prefers python3-systemd if available; otherwise falls back to `journalctl`.
+    """
+    return list(iter_zram_logs(unit=unit, count=count))
 
 
 def _parse_iso_best_effort(s: str) -> Optional[datetime]:
@@ -56,7 +56,7 @@ def get_psi(resource: str) -> Optional[PsiStats]:
     path = PROC_PSI_PATH / resource
     content = read_file(path)
     if not content:
-        _LOGGER.debug(f"PSI resource not found or empty at {path}")
+        _LOGGER.debug("PSI resource not found or empty at %s", path)
         return None
 
     try:
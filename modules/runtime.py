@@ -10,30 +10,50 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from core.utils.common import read_file
+from core.utils.common import read_file, read_file_ttl
 from core import system_tuning
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# The "available" lists only change when a governor or scheduler module is
+# loaded, so they are read once per path. Failed reads are not cached.
+_AVAILABLE_CACHE: Dict[str, List[str]] = {}
+
+def _read_available(path: str) -> List[str]:
+    cached = _AVAILABLE_CACHE.get(path)
+    if cached is None:
+        content = read_file(path)
+        cached = content.replace("[", "").replace("]", "").split() if content else []
+        if cached:
+            _AVAILABLE_CACHE[path] = cached
+    return list(cached)
+
+def invalidate_runtime_cache() -> None:
+    """Forgets the cached governor and scheduler lists so the next call re-reads sysfs."""
+    _AVAILABLE_CACHE.clear()
+
+
 # --- CPU Governor ---
 
 def get_available_cpu_governors() -> List[str]:
     """Gets the list of available CPU governors from the first CPU core."""
-    path = Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors")
-    content = read_file(path)
-    return content.split() if content else []
+    return _read_available("/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors")
 
 def get_current_cpu_governor() -> str:
     """Gets the current CPU governor of the first CPU core."""
     path = Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor")
-    return read_file(path) or "unknown"
+    return read_file_ttl(path) or "unknown"
 
 def set_cpu_governor(governor: str) -> bool:
     """Orchestrates setting the CPU governor for all online CPU cores."""
     available = get_available_cpu_governors()
+    if governor not in available:
+        # Loading a governor module registers it later; re-read before rejecting
+        invalidate_runtime_cache()
+        available = get_available_cpu_governors()
     return system_tuning.set_cpu_governor(governor, available)
 
 
@@ -41,9 +61,7 @@ def set_cpu_governor(governor: str) -> bool:
 
 def get_available_io_schedulers(device_name: str) -> List[str]:
     """Gets the list of available I/O schedulers for a block device."""
-    path = Path(f"/sys/block/{device_name}/queue/scheduler")
-    content = read_file(path)
-    return content.replace("[", "").replace("]", "").split() if content else []
+    return _read_available(f"/sys/block/{device_name}/queue/scheduler")
 
 def get_current_io_scheduler(device_name: str) -> str:
     """Gets the currently active I/O scheduler for a block device."""
@@ -60,6 +78,10 @@ def get_current_io_scheduler(device_name: str) -> str:
 def set_io_scheduler(device_name: str, scheduler: str) -> bool:
     """Orchestrates setting the I/O scheduler for a given block device."""
     available = get_available_io_schedulers(device_name)
+    if scheduler not in available:
+        # Same as governors: bfq/kyber appear once their module is loaded
+        invalidate_runtime_cache()
+        available = get_available_io_schedulers(device_name)
     return system_tuning.set_io_scheduler(device_name, scheduler, available)
 
 
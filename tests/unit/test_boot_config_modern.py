@@ -7,15 +7,12 @@ from core import boot_config
 class TestSysctlTuning(BaseTestCase):
     @patch("core.boot_config.read_file")
     @patch("core.boot_config.atomic_write_to_file")
-    @patch("core.boot_config.run")
     @patch("pathlib.Path.exists")
-    def test_apply_sysctl_values_success(
-        self, mock_exists, mock_run, mock_write, mock_read
-    ):
+    def test_apply_sysctl_values_success(self, mock_exists, mock_write, mock_read):
         with (
             patch("core.utils.io.pkexec_write", return_value=(True, None)) as m_write,
             patch(
-                "core.utils.privilege.pkexec_sysctl_system", return_value=(True, None)
+                "core.boot_config._write_sysctl_live", return_value=(True, None)
             ) as m_sysctl,
         ):
             mock_read.return_value = (
@@ -40,7 +37,7 @@ class TestSysctlTuning(BaseTestCase):
                 "core.utils.io.pkexec_write", return_value=(False, "Permission denied")
             ),
             patch(
-                "core.utils.privilege.pkexec_sysctl_system", return_value=(True, None)
+                "core.boot_config._write_sysctl_live", return_value=(True, None)
             ),
         ):
             settings = {"vm.swappiness": "100"}
@@ -65,6 +62,207 @@ class TestSysctlTuning(BaseTestCase):
         self.assertTrue(result.success)
         self.assertFalse(result.changed)
 
+    def test_apply_sysctl_values_batch_single_write(self):
+        with (
+            patch("core.boot_config.read_file", return_value=""),
+            patch("core.utils.io.pkexec_write", return_value=(True, None)) as m_write,
+            patch(
+                "core.boot_config._write_sysctl_live", return_value=(True, None)
+            ) as m_sysctl,
+        ):
+            result = boot_config.apply_sysctl_values_batch(
+                [{"vm.swappiness": "100"}, {"vm.swappiness": "120", "vm.page-cluster": "0"}]
+            )
+
+            self.assertTrue(result.success)
+            m_write.assert_called_once()
+            m_sysctl.assert_called_once()
+            written = m_write.call_args.args[1]
+            self.assertIn("vm.swappiness = 120", written)
+            self.assertIn("vm.page-cluster = 0", written)
+
+
+class TestSysctlProfile(BaseTestCase):
+    def _read_side_effect(self, live_swappiness, file_content=None):
+        from core.utils.grub_paths import SYSCTL_GAMING_PROFILE
+
+        file_content = file_content or SYSCTL_GAMING_PROFILE
+        live = {
+            "/proc/sys/vm/swappiness": live_swappiness,
+            "/proc/sys/vm/watermark_boost_factor": "0",
+            "/proc/sys/vm/watermark_scale_factor": "125",
+            "/proc/sys/vm/page-cluster": "0",
+        }
+        return lambda path: live.get(str(path), file_content)
+
+    def test_profile_already_configured_and_live(self):
+        with (
+            patch("core.boot_config.read_file", side_effect=self._read_side_effect("180")),
+            patch("core.boot_config._write_sysctl_live") as m_live,
+            patch("core.utils.io.pkexec_write") as m_write,
+        ):
+            result = boot_config.apply_sysctl_profile(True)
+
+            self.assertTrue(result.success)
+            self.assertFalse(result.changed)
+            m_live.assert_not_called()
+            m_write.assert_not_called()
+
+    def test_profile_matches_regardless_of_order_and_format(self):
+        """A file with the same settings in sorted order counts as configured."""
+        custom = (
+            "# Custom Z-Manager Tuning Configuration\n"
+            "vm.page-cluster = 0\n"
+            "vm.swappiness=180\n"
+            "vm.watermark_boost_factor = 0\n"
+            "vm.watermark_scale_factor = 125\n"
+        )
+        with (
+            patch(
+                "core.boot_config.read_file",
+                side_effect=self._read_side_effect("180", custom),
+            ),
+            patch("core.boot_config._write_sysctl_live") as m_live,
+            patch("core.utils.io.pkexec_write") as m_write,
+        ):
+            result = boot_config.apply_sysctl_profile(True)
+
+            self.assertFalse(result.changed)
+            m_live.assert_not_called()
+            m_write.assert_not_called()
+
+    def test_profile_exact_file_skips_parse(self):
+        """Our own unmodified drop-in is recognised without parsing it."""
+        with (
+            patch("core.boot_config.read_file", side_effect=self._read_side_effect("180")),
+            patch("core.boot_config._parse_sysctl") as m_parse,
+            patch("core.utils.io.pkexec_write") as m_write,
+        ):
+            result = boot_config.apply_sysctl_profile(True)
+
+            self.assertFalse(result.changed)
+            m_parse.assert_not_called()
+            m_write.assert_not_called()
+
+    def test_profile_configured_but_live_drifted(self):
+        with (
+            patch("core.boot_config.read_file", side_effect=self._read_side_effect("60")),
+            patch(
+                "core.boot_config._write_sysctl_live", return_value=(True, None)
+            ) as m_live,
+            patch("core.utils.io.pkexec_write") as m_write,
+        ):
+            result = boot_config.apply_sysctl_profile(True)
+
+            self.assertTrue(result.success)
+            self.assertTrue(result.changed)
+            m_live.assert_called_once()
+            m_write.assert_not_called()
+
+
+class TestGrubDropIns(BaseTestCase):
+    def test_configured_file_skips_cmdline_check(self):
+        from core.utils.grub_paths import GRUB_PSI_ENABLE_CONTENT
+
+        with (
+            patch("core.boot_config.detect_bootloader", return_value="grub"),
+            patch("core.boot_config.read_file", return_value=GRUB_PSI_ENABLE_CONTENT),
+            patch("core.boot_config.is_kernel_param_active") as m_active,
+            patch("core.utils.io.pkexec_write") as m_write,
+        ):
+            result = boot_config.set_psi_in_grub(True)
+
+            self.assertFalse(result.changed)
+            self.assertEqual(result.action_needed, "update-grub")
+            m_active.assert_not_called()
+            m_write.assert_not_called()
+
+
+    def test_snapshot_skips_bootloader_probe_and_reads(self):
+        from core.utils.grub_paths import GRUB_PSI_ENABLE_CONTENT
+
+        snapshot = boot_config.BootConfigSnapshot(
+            bootloader="grub",
+            sysctl_content=None,
+            grub_zswap_content=None,
+            grub_psi_content=GRUB_PSI_ENABLE_CONTENT,
+        )
+        with (
+            patch("core.boot_config.detect_bootloader") as m_detect,
+            patch("core.boot_config.read_file") as m_read,
+            patch("core.utils.io.pkexec_write") as m_write,
+        ):
+            result = boot_config.set_psi_in_grub(True, snapshot)
+
+            self.assertFalse(result.changed)
+            m_detect.assert_not_called()
+            m_read.assert_not_called()
+            m_write.assert_not_called()
+
+
+class TestSysctlParse(BaseTestCase):
+    def test_parse_handles_comments_and_ignore_prefix(self):
+        content = (
+            "# comment\n"
+            "; another comment\n"
+            "vm.swappiness=180\n"
+            "  -vm.page-cluster = 0  \n"
+            "net/ipv4/ip_forward = 1\n"
+            "not a setting\n"
+        )
+        self.assertEqual(
+            boot_config._parse_sysctl(content),
+            {
+                "vm.swappiness": "180",
+                "vm.page-cluster": "0",
+                "net/ipv4/ip_forward": "1",
+            },
+        )
+
+
+class TestSysctlLiveApply(BaseTestCase):
+    def test_writes_directly_to_proc_sys(self):
+        with (
+            patch("pathlib.Path.write_text", autospec=True) as m_write_text,
+            patch("core.utils.privilege.pkexec_sysctl_load") as m_sysctl,
+        ):
+            ok, err = boot_config._write_sysctl_live(
+                {"vm.swappiness": "180", "vm.page-cluster": "0"}
+            )
+
+            self.assertTrue(ok)
+            self.assertIsNone(err)
+            written = {str(c.args[0]): c.args[1] for c in m_write_text.call_args_list}
+            self.assertEqual(
+                written,
+                {"/proc/sys/vm/swappiness": "180", "/proc/sys/vm/page-cluster": "0"},
+            )
+            m_sysctl.assert_not_called()
+
+    def test_revert_to_defaults_writes_proc_sys(self):
+        with (
+            patch("pathlib.Path.write_text", autospec=True) as m_write_text,
+            patch("core.utils.common.subprocess.run") as m_run,
+        ):
+            self.assertTrue(boot_config._revert_sysctl_to_defaults())
+
+            written = {str(c.args[0]): c.args[1] for c in m_write_text.call_args_list}
+            self.assertEqual(written["/proc/sys/vm/swappiness"], "60")
+            self.assertEqual(written["/proc/sys/vm/page-cluster"], "3")
+            m_run.assert_not_called()
+
+    def test_falls_back_to_sysctl_load(self):
+        with (
+            patch("pathlib.Path.write_text", side_effect=PermissionError("denied")),
+            patch(
+                "core.utils.privilege.pkexec_sysctl_load", return_value=(True, None)
+            ) as m_sysctl,
+        ):
+            ok, _ = boot_config._write_sysctl_live({"vm.swappiness": "180"})
+
+            self.assertTrue(ok)
+            m_sysctl.assert_called_once_with("/etc/sysctl.d/99-z-manager.conf")
+
 
 if __name__ == "__main__":
     unittest.main()
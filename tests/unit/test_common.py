@@ -0,0 +1,89 @@
+from tests.test_base import *
+import os
+import subprocess
+import tempfile
+
+from core.utils import common
+
+
+class TestReadSysfsCached(BaseTestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.unlink, self.path)
+        self.addCleanup(common.close_sysfs_fds)
+
+    def test_repeat_reads_reuse_fd(self):
+        with open(self.path, "w") as f:
+            f.write("100\n")
+        self.assertEqual(common.read_sysfs_cached(self.path), "100")
+
+        with open(self.path, "w") as f:
+            f.write("200\n")
+        with patch("core.utils.common.os.open") as mock_open:
+            self.assertEqual(common.read_sysfs_cached(self.path), "200")
+            mock_open.assert_not_called()
+
+    def test_missing_attribute_returns_none(self):
+        self.assertIsNone(common.read_sysfs_cached(self.path + ".missing"))
+
+
+class TestReadFile(BaseTestCase):
+
+    def test_reads_and_normalizes_newlines(self):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.unlink, path)
+        os.write(fd, b"[zram0]\r\nzram-size = 4G\r\n")
+        os.close(fd)
+        self.assertEqual(common.read_file(path), "[zram0]\nzram-size = 4G")
+
+    def test_missing_or_directory_returns_none(self):
+        self.assertIsNone(common.read_file("/nonexistent/zman/path"))
+        self.assertIsNone(common.read_file(tempfile.gettempdir()))
+
+
+class TestReadFileTtl(BaseTestCase):
+
+    def setUp(self):
+        common.invalidate_file_ttl()
+        self.addCleanup(common.invalidate_file_ttl)
+
+    @patch("core.utils.common.read_file", return_value="Y")
+    def test_reads_within_ttl_are_cached(self, mock_read):
+        self.assertEqual(common.read_file_ttl("/sys/x"), "Y")
+        self.assertEqual(common.read_file_ttl("/sys/x"), "Y")
+        mock_read.assert_called_once()
+
+        common.invalidate_file_ttl("/sys/x")
+        common.read_file_ttl("/sys/x")
+        self.assertEqual(mock_read.call_count, 2)
+
+    @patch("core.utils.common.read_file", return_value="Y")
+    def test_zero_ttl_always_reads(self, mock_read):
+        common.read_file_ttl("/sys/x", ttl=0)
+        common.read_file_ttl("/sys/x", ttl=0)
+        self.assertEqual(mock_read.call_count, 2)
+
+
+class TestRunStatus(BaseTestCase):
+
+    @patch("core.utils.common.subprocess.call", return_value=3)
+    def test_output_is_discarded(self, mock_call):
+        self.assertEqual(common.run_status(["/sbin/swapoff", "/dev/zram0"]), 3)
+        mock_call.assert_called_once_with(
+            ["/sbin/swapoff", "/dev/zram0"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False
+        )
+
+    def test_bare_command_resolved_once(self):
+        common._which.cache_clear()
+        self.addCleanup(common._which.cache_clear)
+        with patch("core.utils.common.shutil.which", return_value="/usr/bin/systemctl") as mock_which:
+            self.assertEqual(common._spawn_argv(["systemctl", "status"]), ["/usr/bin/systemctl", "status"])
+            common._spawn_argv(["systemctl", "restart"])
+            mock_which.assert_called_once_with("systemctl")
+        self.assertEqual(common._spawn_argv(["/bin/true"]), ["/bin/true"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,10 @@
 from tests.test_base import *
-from core.config import _parse_systemd_cat_config, EffectiveConfig
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from core.config import _parse_systemd_cat_config, EffectiveConfig, _load_config_file, _TEXT_CACHE
+from core import config as zram_config
 
 class TestConfigProvenance(BaseTestCase):
     def test_deep_merge_parsing(self):
@@ -37,5 +42,80 @@ swap-priority = 100
         self.assertEqual(len(effective.config), 0)
         self.assertEqual(len(effective.provenance), 0)
 
+class TestConfigTextCache(BaseTestCase):
+    def setUp(self):
+        fd, name = tempfile.mkstemp(suffix=".conf")
+        os.close(fd)
+        self.path = Path(name)
+        self.path.write_text("[zram0]\nzram-size = 4G\n", encoding="utf-8")
+        self.addCleanup(self.path.unlink)
+        self.addCleanup(_TEXT_CACHE.pop, str(self.path), None)
+
+    def test_reparse_returns_independent_objects(self):
+        """Mutating one parsed config must not leak into the next read."""
+        first = _load_config_file(self.path)
+        first['zram0']['zram-size'] = '8G'
+        second = _load_config_file(self.path)
+        self.assertEqual(second['zram0']['zram-size'], '4G')
+
+    def test_file_read_once_until_mtime_changes(self):
+        """The file is only re-read when its mtime moves."""
+        _load_config_file(self.path)
+        with patch.object(Path, 'read_text', side_effect=AssertionError("re-read")):
+            self.assertEqual(_load_config_file(self.path)['zram0']['zram-size'], '4G')
+
+        self.path.write_text("[zram0]\nzram-size = 2G\n", encoding="utf-8")
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(_load_config_file(self.path)['zram0']['zram-size'], '2G')
+
+class TestCatConfigCache(BaseTestCase):
+    def setUp(self):
+        zram_config.invalidate_config_cache()
+        self.addCleanup(zram_config.invalidate_config_cache)
+
+    @patch("core.config._config_signature")
+    @patch("core.config.run")
+    def test_systemd_analyze_runs_once_until_files_change(self, mock_run, mock_sig):
+        mock_run.return_value = MagicMock(out="# /etc/systemd/zram-generator.conf\n[zram0]\nzram-size = 4G\n")
+        mock_sig.return_value = (("/etc/systemd/zram-generator.conf", 1, 10),)
+
+        first = zram_config.read_zram_config()
+        first['zram0']['zram-size'] = '8G'
+        self.assertEqual(zram_config.read_zram_config()['zram0']['zram-size'], '4G')
+        self.assertEqual(mock_run.call_count, 1)
+
+        mock_sig.return_value = (("/etc/systemd/zram-generator.conf", 2, 10),)
+        zram_config.read_zram_config()
+        self.assertEqual(mock_run.call_count, 2)
+
+class TestActivePathCache(BaseTestCase):
+    def setUp(self):
+        zram_config.invalidate_config_cache()
+        self.addCleanup(zram_config.invalidate_config_cache)
+
+    def test_lookup_reused_within_ttl(self):
+        with patch("core.config.os.stat", return_value=MagicMock(st_mtime_ns=1)) as mock_stat:
+            first = zram_config.get_active_config_path()
+            self.assertEqual(zram_config.get_active_config_path(), first)
+            self.assertEqual(mock_stat.call_count, 1)
+
+            zram_config.invalidate_config_cache()
+            zram_config.get_active_config_path()
+            self.assertEqual(mock_stat.call_count, 2)
+
+    def test_higher_priority_file_created_later_wins(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp)
+        etc, usr = tmp / "etc.conf", tmp / "usr.conf"
+        usr.write_text("[zram0]\n", encoding="utf-8")
+        pairs = ((etc, str(etc)), (usr, str(usr)))
+
+        # No invalidation: once the TTL lapses the new file must be found on its own
+        with patch("core.config._SEARCH_PATH_PAIRS", pairs), patch("core.config._PATH_TTL", 0):
+            self.assertEqual(zram_config.get_active_config_path(), usr)
+            etc.write_text("[zram0]\n", encoding="utf-8")
+            self.assertEqual(zram_config.get_active_config_path(), etc)
+
 if __name__ == "__main__":
     unittest.main()
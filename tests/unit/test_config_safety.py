@@ -91,5 +91,34 @@ class TestConfigSafety(BaseTestCase):
         # Should imply NO backup because write was skipped
         self.assertFalse(os.path.exists(backup_path), "Backup created unnecessarily for identical content!")
 
+    def test_bytes_content(self):
+        """Verify pre-encoded bytes are written verbatim and diff-checked too."""
+        content = "vm.swappiness = 180\n".encode("utf-8")
+        success, err = atomic_write_to_file(self.file_path, content)
+        self.assertTrue(success, f"Bytes write failed: {err}")
+        with open(self.file_path, 'rb') as f:
+            self.assertEqual(f.read(), content)
+
+        mtime_1 = os.stat(self.file_path).st_mtime_ns
+        time.sleep(0.01)
+        atomic_write_to_file(self.file_path, content)
+        self.assertEqual(mtime_1, os.stat(self.file_path).st_mtime_ns)
+
+    def test_written_file_is_world_readable(self):
+        """The replaced file carries 0644, not mkstemp's 0600, and no temp file is left."""
+        success, err = atomic_write_to_file(self.file_path, "content")
+        self.assertTrue(success, f"Write failed: {err}")
+        self.assertEqual(os.stat(self.file_path).st_mode & 0o777, 0o644)
+        self.assertEqual(os.listdir(self.test_dir), ["test.conf"])
+
+    @patch("core.utils.io.os.fsync")
+    def test_fsync_is_opt_in(self, mock_fsync):
+        """No flush by default; fsync=True flushes the file and its directory."""
+        atomic_write_to_file(self.file_path, "one")
+        mock_fsync.assert_not_called()
+
+        atomic_write_to_file(self.file_path, "two", fsync=True)
+        self.assertEqual(mock_fsync.call_count, 2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ import shutil
 import tempfile
 from pathlib import Path
 from tests.test_base import *
-from core.config import load_effective_config_state
+from core.config import load_effective_config_state, apply_config_with_restart
 
 class TestConfigSystemdIntegration(BaseTestCase):
     def setUp(self):
@@ -54,5 +54,40 @@ class TestConfigSystemdIntegration(BaseTestCase):
         self.assertIn("etc/systemd/zram-generator.conf", prov['zram-size'])
         self.assertIn("usr/lib/systemd/zram-generator.conf.d/10-tweak.conf", prov['algo'])
 
+class TestApplyConfigWithRestart(BaseTestCase):
+    @patch("core.config.systemd_try_restart")
+    @patch("core.config.systemd_restart_if_active", return_value=(True, None))
+    @patch("core.config.systemd_daemon_reload")
+    def test_try_mode_uses_try_restart(self, mock_reload, mock_if_active, mock_restart):
+        res = apply_config_with_restart("zram0")
+        self.assertTrue(res.success)
+        mock_reload.assert_called_once()
+        mock_if_active.assert_called_once_with("systemd-zram-setup@zram0.service")
+        mock_restart.assert_not_called()
+
+    @patch("core.config.systemd_restart_if_active")
+    @patch("core.config.systemd_try_restart", return_value=(True, None))
+    @patch("core.config.systemd_daemon_reload")
+    def test_force_mode_restarts_unconditionally(self, mock_reload, mock_restart, mock_if_active):
+        res = apply_config_with_restart("zram0", restart_mode="force")
+        self.assertTrue(res.applied)
+        mock_restart.assert_called_once_with("systemd-zram-setup@zram0.service")
+        mock_if_active.assert_not_called()
+
+    @patch("core.config.systemd_restart_if_active", return_value=(False, "job failed"))
+    @patch("core.config.systemd_daemon_reload")
+    def test_failed_restart_is_reported(self, mock_reload, mock_if_active):
+        res = apply_config_with_restart("zram0")
+        self.assertFalse(res.success)
+        self.assertIn("job failed", res.message)
+
+    @patch("core.config.systemd_daemon_reload")
+    @patch("core.config.systemd_restart_if_active")
+    def test_global_section_rejected_before_systemd(self, mock_if_active, mock_reload):
+        res = apply_config_with_restart("zram-generator")
+        self.assertFalse(res.success)
+        mock_if_active.assert_not_called()
+        mock_reload.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ from configobj import ConfigObj
 
 class TestGlobalConfig(BaseTestCase):
     
-    @patch('core.config.read_zram_config')
+    @patch('core.config.load_effective_config')
     @patch('core.config_writer._read_local_config')
     def test_global_config_read_write(self, mock_read_writer, mock_read_reader):
         # Setup Mock Config
@@ -13,7 +13,7 @@ class TestGlobalConfig(BaseTestCase):
         mock_cfg['zram-generator'] = {'conf-file': '/foo/bar'}
         mock_cfg['zram0'] = {'zram-size': 'ram'}
         
-        mock_read_reader.return_value = mock_cfg
+        mock_read_reader.return_value = "[zram-generator]\nconf-file = /foo/bar\n\n[zram0]\nzram-size = ram\n"
         mock_read_writer.return_value = mock_cfg
         
         # Test Read
@@ -29,5 +29,30 @@ class TestGlobalConfig(BaseTestCase):
         # Should preserve existing
         self.assertIn('conf-file = /foo/bar', rendered)
 
+    @patch('core.config.load_effective_config')
+    def test_global_config_merges_drop_ins(self, mock_raw):
+        """Later files override earlier ones, as in the cat-config merge."""
+        mock_raw.return_value = (
+            "# /usr/lib/systemd/zram-generator.conf\n"
+            "[zram-generator]\n"
+            "conf-file = /usr/lib/foo\n"
+            "[zram0]\n"
+            "conf-file = not-global\n"
+            "# /etc/systemd/zram-generator.conf.d/10-local.conf\n"
+            "[zram-generator]\n"
+            "conf-file = /etc/foo\n"
+        )
+        self.assertEqual(read_global_config(), {'conf-file': '/etc/foo'})
+
+    @patch('core.config.load_effective_config')
+    def test_global_config_matches_configobj_syntax(self, mock_raw):
+        """Spaced or commented headers and inline comments read as ConfigObj reads them."""
+        mock_raw.return_value = (
+            "[ zram-generator ] # global\n"
+            "conf-file = /foo # comment\n"
+            "quoted = \"a # b\"\n"
+        )
+        self.assertEqual(read_global_config(), {'conf-file': '/foo', 'quoted': '"a # b"'})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,35 @@
+from tests.test_base import *
+from core import health
+
+
+class TestSystemHealth(BaseTestCase):
+
+    @patch("core.health._devices_summary", return_value="0 device(s)")
+    @patch("core.health.get_zswap_status", return_value=health.ZswapStatus(False, None))
+    @patch("core.health._journal_available")
+    @patch("core.health._check_cmd_available", return_value=True)
+    @patch("core.health._is_systemd", return_value=False)
+    def test_non_systemd_skips_probes(self, mock_booted, mock_cmd, mock_journal, mock_zswap, mock_summary):
+        report = health.check_system_health()
+
+        self.assertFalse(report.systemd_available)
+        self.assertFalse(report.journal_available)
+        mock_journal.assert_not_called()
+        self.assertNotIn("systemctl", [c.args[0] for c in mock_cmd.call_args_list])
+        self.assertEqual(sum("systemd" in n for n in report.notes), 1)
+
+    @patch("core.health._devices_summary", return_value="0 device(s)")
+    @patch("core.health.get_zswap_status", return_value=health.ZswapStatus(False, None))
+    @patch("core.health._journal_available", return_value=True)
+    @patch("core.health._check_cmd_available", return_value=True)
+    @patch("core.health._is_systemd", return_value=True)
+    def test_systemd_host_reports_available(self, mock_booted, mock_cmd, mock_journal, mock_zswap, mock_summary):
+        report = health.check_system_health()
+
+        self.assertTrue(report.systemd_available)
+        self.assertTrue(report.journal_available)
+        self.assertEqual(report.notes, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
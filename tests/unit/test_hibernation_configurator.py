@@ -3,7 +3,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from core.utils.bootloader import detect_bootloader, detect_initramfs_system
-from core.utils.kernel_cmdline import is_kernel_param_active
+from core.utils.kernel_cmdline import is_kernel_param_active, _cmdline_tokens
 from core.hibernation.configurator import (
     update_grub_resume,
     configure_initramfs_resume,
@@ -95,21 +95,34 @@ class TestResumeConfig(BaseTestCase):
 
 
 class TestKernelParam(BaseTestCase):
-    @patch("core.utils.kernel_cmdline.read_file")
+    def setUp(self):
+        super().setUp()
+        _cmdline_tokens.cache_clear()
+        self.addCleanup(_cmdline_tokens.cache_clear)
+
+    @patch("core.utils.kernel_cmdline.read_proc_small")
     def test_is_kernel_param_active_present(self, mock_read):
         mock_read.return_value = "quiet resume=UUID=abc-123 resume_offset=34816 splash"
         self.assertTrue(is_kernel_param_active("resume="))
 
-    @patch("core.utils.kernel_cmdline.read_file")
+    @patch("core.utils.kernel_cmdline.read_proc_small")
     def test_is_kernel_param_active_missing(self, mock_read):
         mock_read.return_value = "quiet splash"
         self.assertFalse(is_kernel_param_active("resume="))
 
-    @patch("core.utils.kernel_cmdline.read_file")
+    @patch("core.utils.kernel_cmdline.read_proc_small")
     def test_is_kernel_param_active_empty_cmdline(self, mock_read):
         mock_read.return_value = ""
         self.assertFalse(is_kernel_param_active("resume="))
 
+    @patch("core.utils.kernel_cmdline.read_proc_small")
+    def test_cmdline_read_once(self, mock_read):
+        mock_read.return_value = "quiet zswap.enabled=0 psi=1"
+        self.assertTrue(is_kernel_param_active("zswap.enabled=0"))
+        self.assertTrue(is_kernel_param_active("psi=1"))
+        self.assertFalse(is_kernel_param_active("resume="))
+        mock_read.assert_called_once_with("/proc/cmdline")
+
 
 if __name__ == "__main__":
     unittest.main()
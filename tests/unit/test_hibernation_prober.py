@@ -9,7 +9,7 @@ from core.hibernation.prober import (
     get_memory_info,
     get_fs_type,
 )
-from core.utils.swap import detect_resume_swap
+from core.utils.swap import detect_resume_swap, is_device_in_swaps
 
 
 class TestProber(BaseTestCase):
@@ -106,6 +106,14 @@ File size of /swapfile is 4294967296 (1048576 blocks, blocksize 4096)
         with patch("core.utils.swap.read_file", return_value=""):
             self.assertIsNone(detect_resume_swap())
 
+    def test_is_device_in_swaps_reads_proc_directly(self):
+        with patch("core.utils.swap.read_file") as mock_read:
+            mock_read.return_value = """Filename                Type        Size    Used    Priority
+/dev/zram10             partition   4096000 0       100"""
+            self.assertTrue(is_device_in_swaps("zram10"))
+            self.assertFalse(is_device_in_swaps("zram1"))
+            mock_read.assert_called_with("/proc/swaps")
+
     def test_get_memory_info(self):
         with patch("core.hibernation.prober.read_file") as mock_read:
             mock_read.return_value = (
@@ -103,6 +103,56 @@ class TestListZramLogs(BaseTestCase):
         self.assertEqual(records, [])
 
 
+class TestIterZramLogs(BaseTestCase):
+    def test_streams_oldest_first_from_reader(self):
+        """The reader steps back `count` entries once, then walks forward."""
+        entries = [{"MESSAGE": f"msg{i}", "PRIORITY": 6} for i in range(3)]
+        reader = MagicMock()
+        reader.get_previous.return_value = entries[0]
+        reader.get_next.side_effect = [entries[1], entries[2], {}]
+        fake_journal = MagicMock()
+        fake_journal.Reader.return_value = reader
+        fake_systemd = MagicMock(journal=fake_journal)
+
+        with patch.dict(
+            "sys.modules", {"systemd": fake_systemd, "systemd.journal": fake_journal}
+        ):
+            records = journal.iter_zram_logs(count=3)
+            self.assertEqual(next(records).message, "msg0")
+            self.assertEqual([r.message for r in records], ["msg1", "msg2"])
+
+        reader.get_previous.assert_called_once_with(3)
+
+    def _fake_modules(self, reader):
+        fake_journal = MagicMock()
+        fake_journal.Reader.return_value = reader
+        return {"systemd": MagicMock(journal=fake_journal), "systemd.journal": fake_journal}
+
+    @patch("modules.journal.run")
+    def test_read_error_before_first_record_falls_back(self, mock_run):
+        mock_run.return_value = MagicMock(code=0, out="2024-01-15T10:30:00+05:30 from journalctl\n")
+        reader = MagicMock()
+        reader.get_previous.return_value = {"MESSAGE": "msg0", "PRIORITY": 6}
+
+        with patch.dict("sys.modules", self._fake_modules(reader)), \
+                patch("modules.journal._record_from_entry", side_effect=ValueError("corrupt")):
+            records = list(journal.iter_zram_logs(count=1))
+
+        self.assertEqual([r.message for r in records], ["from journalctl"])
+
+    @patch("modules.journal.run")
+    def test_read_error_midway_stops_cleanly(self, mock_run):
+        reader = MagicMock()
+        reader.get_previous.return_value = {"MESSAGE": "msg0", "PRIORITY": 6}
+        reader.get_next.side_effect = OSError("journal rotated")
+
+        with patch.dict("sys.modules", self._fake_modules(reader)):
+            records = list(journal.iter_zram_logs(count=2))
+
+        self.assertEqual([r.message for r in records], ["msg0"])
+        mock_run.assert_not_called()
+
+
 class TestListZramLogsRecords(BaseTestCase):
     @patch("modules.journal.list_zram_logs")
     def test_returns_records(self, mock_list):
@@ -3,6 +3,10 @@ from core.utils import zram_stats as os_utils
 
 class TestSysfsParser(BaseTestCase):
 
+    def setUp(self):
+        os_utils.invalidate_zram_cache()
+        self.addCleanup(os_utils.invalidate_zram_cache)
+
     @patch('core.utils.zram_stats.scan_zram_devices')
     @patch('core.utils.zram_stats.get_zram_props')
     def test_parse_standard_device(self, mock_read, mock_scan):
@@ -38,7 +42,7 @@ class TestSysfsParser(BaseTestCase):
         mock_scan.return_value = ['zram0', 'zram1']
         
         # Side effect to return different props for different devices
-        def side_effect(dev_name):
+        def side_effect(dev_name, mount_index=None):
             if dev_name == 'zram0':
                 return {"name": "zram0", "disksize": "4G", "algorithm": "lz4", "mountpoint": "[SWAP]"}
             else:
@@ -83,5 +87,86 @@ class TestSysfsParser(BaseTestCase):
         devices = os_utils.parse_zramctl_table()
         self.assertEqual(len(devices), 0)
 
+    @patch('core.utils.zram_stats.build_mountpoint_index', return_value={})
+    @patch('core.utils.zram_stats.scan_zram_devices')
+    @patch('core.utils.zram_stats.get_zram_props')
+    def test_mount_index_shared_across_devices(self, mock_read, mock_scan, mock_index):
+        mock_scan.return_value = ['zram0', 'zram1']
+        mock_read.return_value = {"name": "zram0", "disksize": "4G"}
+
+        os_utils.parse_zramctl_table()
+
+        mock_index.assert_called_once()
+        indexes = [c.args[1] for c in mock_read.call_args_list]
+        self.assertIs(indexes[0], indexes[1])
+
+    @patch('core.utils.zram_stats.build_mountpoint_index')
+    @patch('core.utils.zram_stats.scan_zram_devices', return_value=[])
+    def test_no_devices_skips_proc_tables(self, mock_scan, mock_index):
+        self.assertEqual(os_utils.parse_zramctl_table(), [])
+        mock_index.assert_not_called()
+
+    def test_mountpoint_index_matches_exact_device(self):
+        tables = {
+            "/proc/swaps": "Filename\tType\tSize\tUsed\tPriority\n/dev/zram10 partition 100 0 100\n",
+            "/proc/mounts": "/dev/sda1 / ext4 rw 0 0\n/dev/zram1 /mnt/scratch ext4 rw 0 0\n/dev/zram10 /mnt/other ext4 rw 0 0\n",
+        }
+        with patch('core.utils.zram_stats.Path.read_text', autospec=True,
+                   side_effect=lambda p, encoding=None: tables[str(p)]) as mock_read_text:
+            index = os_utils.build_mountpoint_index()
+            self.assertEqual(mock_read_text.call_count, 2)
+        self.assertEqual(os_utils.get_zram_mountpoint('zram10', index), '[SWAP]')
+        self.assertEqual(os_utils.get_zram_mountpoint('zram1', index), '/mnt/scratch')
+        self.assertEqual(os_utils.get_zram_mountpoint('zram2', index), '')
+        self.assertNotIn('/dev/sda1', index)
+
+    @patch('core.utils.zram_stats.get_zram_mountpoint', return_value='')
+    @patch('core.utils.zram_stats.read_sysfs_cached')
+    def test_active_algorithm_sliced_from_brackets(self, mock_sysfs, mock_mount):
+        sysfs = {"comp_algorithm": "lzo lzo-rle [zstd] lz4"}
+        mock_sysfs.side_effect = lambda p: sysfs.get(p.rsplit('/', 1)[1])
+        self.assertEqual(os_utils.get_zram_props('zram0')['algorithm'], 'zstd')
+
+        sysfs["comp_algorithm"] = "lz4"
+        self.assertEqual(os_utils.get_zram_props('zram0')['algorithm'], 'lz4')
+
+    @patch('core.utils.zram_stats.get_zram_mountpoint', return_value='')
+    @patch('core.utils.zram_stats.read_sysfs_cached')
+    def test_ratio_uses_raw_mm_stat_counters(self, mock_sysfs, mock_mount):
+        # 3000 / 1024 bytes would round to "2.9K" / "1K" (ratio 2.9) via the human strings
+        sysfs = {"disksize": "1073741824", "mm_stat": "3000 1024 4096 0 4096 0 0"}
+        mock_sysfs.side_effect = lambda p: sysfs.get(p.rsplit('/', 1)[1])
+        self.assertEqual(os_utils.get_zram_props('zram0')['ratio'], 2.93)
+
+    @patch('core.utils.zram_stats.build_mountpoint_index', return_value={})
+    @patch('core.utils.zram_stats.scan_zram_devices', return_value=['zram0'])
+    @patch('core.utils.zram_stats.get_zram_props')
+    def test_table_reused_until_invalidated(self, mock_read, mock_scan, mock_index):
+        mock_read.return_value = {"name": "zram0", "disksize": "4G"}
+
+        first = os_utils.parse_zramctl_table()
+        first[0]["disksize"] = "mutated"
+        self.assertEqual(os_utils.parse_zramctl_table()[0]["disksize"], "4G")
+        mock_scan.assert_called_once()
+
+        os_utils.invalidate_zram_cache()
+        os_utils.parse_zramctl_table()
+        self.assertEqual(mock_scan.call_count, 2)
+
+    @patch('core.utils.zram_stats.os.scandir')
+    def test_scan_zram_devices_sorts_numerically(self, mock_scandir):
+        entries = [MagicMock(), MagicMock(), MagicMock(), MagicMock()]
+        for e, name in zip(entries, ['zram10', 'sda', 'zram2', 'zram-control']):
+            e.name = name
+        mock_scandir.return_value.__enter__.return_value = iter(entries)
+
+        self.assertEqual(os_utils.scan_zram_devices(), ['zram2', 'zram10'])
+        for e in entries:
+            e.is_dir.assert_not_called()
+
+    @patch('core.utils.zram_stats.os.scandir', side_effect=FileNotFoundError)
+    def test_scan_zram_devices_without_sysfs(self, mock_scandir):
+        self.assertEqual(os_utils.scan_zram_devices(), [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,9 @@ from tests.test_base import *
 import os
 import tempfile
 from pathlib import Path
-from core.config_writer import update_zram_config
+from configobj import ConfigObj
+from core.config_writer import update_zram_config, remove_device_from_config, generate_config_string, ConfigTransaction
+from core.utils.common import ValidationError
 
 class TestConfigPreservation(BaseTestCase):
     def setUp(self):
@@ -41,6 +43,20 @@ conf-file = /etc/zram-generator.conf
         self.assertIn("# plenty for games", rendered)
         self.assertIn("zram-size = 8G", rendered) # Value updated
 
+    def test_value_edit_keeps_line_formatting(self):
+        """Changing an existing value leaves the inline comment spacing as written."""
+        success, err, rendered = update_zram_config("zram0", {"zram-size": "8G"})
+        self.assertTrue(success, f"Update failed: {err}")
+        self.assertIn("zram-size = 8G # plenty for games", rendered)
+        self.assertIn("compression-algorithm = zstd (level=1)", rendered)
+
+    def test_new_key_falls_back_to_configobj(self):
+        """Adding a key is structural and still goes through ConfigObj."""
+        success, err, rendered = update_zram_config("zram0", {"swap-priority": "100"})
+        self.assertTrue(success, f"Update failed: {err}")
+        self.assertIn("swap-priority = 100", rendered)
+        self.assertIn("zram-size = 4G", rendered)
+
     def test_structure_preservation(self):
         """Verify global section is untouched."""
         success, err, rendered = update_zram_config("zram0", {"compression-algorithm": "lz4"})
@@ -49,5 +65,52 @@ conf-file = /etc/zram-generator.conf
         self.assertIn("[zram-generator]", rendered)
         self.assertIn("conf-file = /etc/zram-generator.conf", rendered)
 
+    def test_rendered_is_newline_terminated(self):
+        """Rendered config is written in canonical form: exactly one trailing newline."""
+        success, err, rendered = update_zram_config("zram0", {"zram-size": "8G"})
+        self.assertTrue(success)
+        self.assertTrue(rendered.endswith("\n"))
+        self.assertFalse(rendered.endswith("\n\n"))
+
+    def test_transaction_batches_edits(self):
+        """Several section edits share one read and keep comments intact."""
+        with ConfigTransaction() as tx:
+            tx.update("zram0", {"zram-size": "8G"})
+            tx.update("zram1", {"zram-size": "2G", "compression-algorithm": "lz4"})
+            tx.remove("zram-generator")
+
+        self.assertIn("# This is my gaming profile", tx.rendered)
+        self.assertIn("zram-size = 8G", tx.rendered)
+        self.assertIn("[zram1]", tx.rendered)
+        self.assertNotIn("[zram-generator]", tx.rendered)
+
+    def test_transaction_rejects_invalid_update(self):
+        """A failed validation aborts the batch without rendering anything."""
+        with self.assertRaises(ValidationError):
+            with ConfigTransaction() as tx:
+                tx.update("zram0", {"zram-size": "8G"})
+                tx.update("zram1", {"zram-size": "4G\n[evil]"})
+        self.assertEqual(tx.rendered, "")
+
+    def test_remove_device_keeps_other_text_verbatim(self):
+        """Removing a section slices it out and leaves the rest untouched."""
+        success, err, rendered = remove_device_from_config("zram-generator")
+        self.assertTrue(success, f"Remove failed: {err}")
+
+        self.assertNotIn("[zram-generator]", rendered)
+        self.assertNotIn("# Global settings", rendered)
+        self.assertIn("zram-size = 4G # plenty for games", rendered)
+        self.assertIn("# This is my gaming profile", rendered)
+
+    def test_generate_config_string(self):
+        """The fixed-shape template parses back to the same section."""
+        rendered = generate_config_string("ram", "zstd", 100, writeback_device="/dev/sdb1")
+        self.assertTrue(rendered.startswith("[zram0]"))
+        self.assertIn("writeback-device = /dev/sdb1", rendered)
+
+        parsed = ConfigObj(rendered.splitlines(), list_values=False)
+        self.assertEqual(parsed["zram0"]["swap-priority"], "100")
+        self.assertEqual(parsed["zram0"]["compression-algorithm"], "zstd")
+
 if __name__ == "__main__":
     unittest.main()
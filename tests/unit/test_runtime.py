@@ -5,6 +5,9 @@ from modules import runtime
 
 
 class TestCpuGovernor(BaseTestCase):
+    def setUp(self):
+        runtime.invalidate_runtime_cache()
+
     @patch("modules.runtime.read_file")
     def test_get_available_cpu_governors(self, mock_read):
         mock_read.return_value = "performance powersave ondemand"
@@ -17,22 +20,23 @@ class TestCpuGovernor(BaseTestCase):
         governors = runtime.get_available_cpu_governors()
         self.assertEqual(governors, [])
 
-    @patch("modules.runtime.read_file")
+    @patch("modules.runtime.read_file_ttl")
     def test_get_current_cpu_governor(self, mock_read):
         mock_read.return_value = "performance"
         governor = runtime.get_current_cpu_governor()
         self.assertEqual(governor, "performance")
 
-    @patch("modules.runtime.read_file")
+    @patch("modules.runtime.read_file_ttl")
     def test_get_current_cpu_governor_unknown(self, mock_read):
         mock_read.return_value = None
         governor = runtime.get_current_cpu_governor()
         self.assertEqual(governor, "unknown")
 
+    @patch("core.system_tuning.is_root", return_value=False)
     @patch("core.system_tuning.pkexec_write")
     @patch("modules.runtime.get_available_cpu_governors")
     @patch.object(Path, "glob")
-    def test_set_cpu_governor_success(self, mock_glob, mock_available, mock_write):
+    def test_set_cpu_governor_success(self, mock_glob, mock_available, mock_write, mock_root):
         mock_available.return_value = ["performance", "powersave"]
         mock_write.return_value = (True, None)
         mock_glob.return_value = [
@@ -43,14 +47,79 @@ class TestCpuGovernor(BaseTestCase):
         result = runtime.set_cpu_governor("performance")
         self.assertTrue(result)
 
+    @patch("core.system_tuning.read_file", return_value="performance")
+    @patch("core.system_tuning.pkexec_write")
+    @patch("modules.runtime.get_available_cpu_governors")
+    @patch.object(Path, "glob")
+    def test_set_cpu_governor_already_set(self, mock_glob, mock_available, mock_write, mock_read):
+        mock_available.return_value = ["performance", "powersave"]
+        mock_glob.return_value = [
+            Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"),
+        ]
+
+        self.assertTrue(runtime.set_cpu_governor("performance"))
+        mock_write.assert_not_called()
+
+    @patch("core.system_tuning.os.close")
+    @patch("core.system_tuning.os.write")
+    @patch("core.system_tuning.os.open", return_value=99)
+    @patch("core.system_tuning.is_root", return_value=True)
+    @patch("core.system_tuning.read_file", return_value="powersave")
+    @patch("core.system_tuning.pkexec_write")
+    @patch("modules.runtime.get_available_cpu_governors")
+    @patch.object(Path, "glob")
+    def test_set_cpu_governor_as_root_writes_in_place(
+        self, mock_glob, mock_available, mock_write, mock_read, mock_root, mock_open, mock_os_write, mock_close
+    ):
+        mock_available.return_value = ["performance", "powersave"]
+        mock_glob.return_value = [
+            Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"),
+            Path("/sys/devices/system/cpu/cpu1/cpufreq/scaling_governor"),
+        ]
+
+        self.assertTrue(runtime.set_cpu_governor("performance"))
+        mock_write.assert_not_called()
+        self.assertEqual(mock_os_write.call_count, 2)
+        mock_os_write.assert_called_with(99, b"performance")
+
     @patch("modules.runtime.get_available_cpu_governors")
     def test_set_cpu_governor_invalid(self, mock_available):
         mock_available.return_value = ["performance", "powersave"]
         result = runtime.set_cpu_governor("invalid_governor")
         self.assertFalse(result)
 
+    @patch("core.system_tuning.set_cpu_governor", return_value=True)
+    @patch("modules.runtime.read_file", return_value="performance powersave")
+    def test_available_governors_read_once(self, mock_read, mock_set):
+        runtime.set_cpu_governor("performance")
+        runtime.set_cpu_governor("powersave")
+        self.assertEqual(runtime.get_available_cpu_governors(), ["performance", "powersave"])
+        mock_read.assert_called_once()
+
+    @patch("modules.runtime.read_file", return_value=None)
+    def test_failed_read_is_not_cached(self, mock_read):
+        runtime.get_available_cpu_governors()
+        runtime.get_available_cpu_governors()
+        self.assertEqual(mock_read.call_count, 2)
+
+    @patch("core.system_tuning.set_cpu_governor", return_value=True)
+    @patch("modules.runtime.get_available_cpu_governors")
+    def test_unknown_governor_rereads_list(self, mock_available, mock_set):
+        mock_available.side_effect = [["powersave"], ["powersave", "conservative"]]
+        runtime.set_cpu_governor("powersave")
+        runtime.set_cpu_governor("conservative")
+        self.assertEqual(mock_available.call_count, 2)
+        self.assertIn("conservative", mock_set.call_args[0][1])
+
 
 class TestIoScheduler(BaseTestCase):
+    def setUp(self):
+        runtime.invalidate_runtime_cache()
+        # Running the suite as root must not write to the real /sys
+        patcher = patch("core.system_tuning.is_root", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("modules.runtime.read_file")
     def test_get_available_io_schedulers(self, mock_read):
         mock_read.return_value = "none [mq-deadline] kyber bfq"
@@ -90,12 +159,32 @@ class TestIoScheduler(BaseTestCase):
         result = runtime.set_io_scheduler("sda", "kyber")
         self.assertTrue(result)
 
+    @patch("core.system_tuning.read_file", return_value="none [kyber] mq-deadline")
+    @patch("core.system_tuning.pkexec_write")
+    @patch("modules.runtime.get_available_io_schedulers")
+    def test_set_io_scheduler_already_active(self, mock_available, mock_write, mock_read):
+        mock_available.return_value = ["none", "mq-deadline", "kyber"]
+
+        self.assertTrue(runtime.set_io_scheduler("sda", "kyber"))
+        mock_write.assert_not_called()
+
     @patch("modules.runtime.get_available_io_schedulers")
     def test_set_io_scheduler_invalid(self, mock_available):
         mock_available.return_value = ["none", "mq-deadline"]
         result = runtime.set_io_scheduler("sda", "invalid_scheduler")
         self.assertFalse(result)
 
+    @patch("core.system_tuning._write_sysfs_direct", return_value=(True, None))
+    @patch("core.system_tuning.read_file", return_value="none [mq-deadline] kyber")
+    @patch("core.system_tuning.pkexec_write")
+    @patch("modules.runtime.get_available_io_schedulers")
+    def test_set_io_scheduler_as_root_writes_in_place(self, mock_available, mock_write, mock_read, mock_direct):
+        mock_available.return_value = ["none", "mq-deadline", "kyber"]
+        with patch("core.system_tuning.is_root", return_value=True):
+            self.assertTrue(runtime.set_io_scheduler("sda", "kyber"))
+        mock_write.assert_not_called()
+        mock_direct.assert_called_once_with(Path("/sys/block/sda/queue/scheduler"), "kyber")
+
     def test_set_io_scheduler_empty_device(self):
         result = runtime.set_io_scheduler("", "mq-deadline")
         self.assertFalse(result)
@@ -106,6 +195,11 @@ class TestIoScheduler(BaseTestCase):
 
 
 class TestVfsCachePressure(BaseTestCase):
+    def setUp(self):
+        patcher = patch("core.system_tuning.is_root", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("modules.runtime.read_file")
     def test_get_vfs_cache_pressure(self, mock_read):
         mock_read.return_value = "100"
@@ -137,6 +231,14 @@ class TestVfsCachePressure(BaseTestCase):
         self.assertTrue(result)
         mock_write.assert_called_once()
 
+    @patch("core.system_tuning._write_sysfs_direct", return_value=(True, None))
+    @patch("core.system_tuning.pkexec_write")
+    def test_set_vfs_cache_pressure_as_root_writes_in_place(self, mock_write, mock_direct):
+        with patch("core.system_tuning.is_root", return_value=True):
+            self.assertTrue(runtime.set_vfs_cache_pressure(50))
+        mock_write.assert_not_called()
+        mock_direct.assert_called_once_with(Path("/proc/sys/vm/vfs_cache_pressure"), "50")
+
     def test_set_vfs_cache_pressure_invalid_negative(self):
         result = runtime.set_vfs_cache_pressure(-1)
         self.assertFalse(result)
@@ -32,5 +32,19 @@ class TestSizeParser(BaseTestCase):
         self.assertEqual(os_utils.parse_size_to_bytes(""), 0)
         self.assertEqual(os_utils.parse_size_to_bytes(None), 0)
 
+    def test_malformed_numbers(self):
+        for bad in ("1..5G", "1.G", ".5G", "1.5.2M", "4G!", "4 G B", "G"):
+            self.assertEqual(os_utils.parse_size_to_bytes(bad), 0, bad)
+
+class TestBytesToHuman(BaseTestCase):
+
+    def test_unit_boundaries(self):
+        self.assertEqual(os_utils.bytes_to_human(0), "0B")
+        self.assertEqual(os_utils.bytes_to_human(1023), "1023B")
+        self.assertEqual(os_utils.bytes_to_human(1024), "1K")
+        self.assertEqual(os_utils.bytes_to_human(1536), "1.5K")
+        self.assertEqual(os_utils.bytes_to_human(4 * 1024**3), "4G")
+        self.assertEqual(os_utils.bytes_to_human(2 * 1024**6), "2048P")
+
 if __name__ == '__main__':
     unittest.main()
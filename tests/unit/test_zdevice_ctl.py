@@ -34,7 +34,7 @@ class TestListDevices(BaseTestCase):
 
 class TestGetWritebackStatus(BaseTestCase):
 
-    @patch('core.device_management.prober.read_file')
+    @patch('core.device_management.prober.read_sysfs_cached')
     @patch('core.device_management.prober.zram_sysfs_dir')
     @patch('core.device_management.prober.is_block_device')
     def test_get_writeback_status_with_backing(self, mock_is_block_dev, mock_sysfs_dir, mock_read):
@@ -60,7 +60,7 @@ class TestGetWritebackStatus(BaseTestCase):
         self.assertEqual(status.device, "zram0")
         self.assertEqual(status.backing_dev, "/dev/loop0")
 
-    @patch('core.device_management.prober.read_file')
+    @patch('core.device_management.prober.read_sysfs_cached')
     @patch('core.device_management.prober.zram_sysfs_dir')
     @patch('core.device_management.prober.is_block_device')
     def test_get_writeback_status_no_backing(self, mock_is_block_dev, mock_sysfs_dir, mock_read):
@@ -173,5 +173,130 @@ class TestPersistResultDataclass(BaseTestCase):
         self.assertTrue(result.applied)
 
 
+class TestReadParamsBestEffort(BaseTestCase):
+
+    @patch('core.device_management.prober.parse_zramctl_table')
+    @patch('core.device_management.prober.get_zram_props')
+    def test_reads_only_the_requested_device(self, mock_props, mock_table):
+        mock_props.return_value = {'name': 'zram1', 'disksize': '2G', 'algorithm': 'zstd'}
+        params = prober.read_params_best_effort('zram1')
+
+        self.assertEqual(params, {'disksize': '2G', 'algorithm': 'zstd', 'streams': None})
+        mock_props.assert_called_once_with('zram1', mount_index={})
+        mock_table.assert_not_called()
+
+    @patch('core.device_management.prober.get_zram_props')
+    def test_unconfigured_device_gets_defaults(self, mock_props):
+        mock_props.return_value = {'name': 'zram1', 'disksize': '-'}
+        self.assertEqual(prober.read_params_best_effort('zram1', '4G')['disksize'], '4G')
+
+        mock_props.side_effect = OSError("gone")
+        self.assertEqual(prober.read_params_best_effort('zram1', '4G')['disksize'], '4G')
+
+
+class TestIsBlockDevice(BaseTestCase):
+
+    def test_single_stat_classifies_paths(self):
+        from core.utils.block import is_block_device
+        with patch("core.utils.block.os.stat", wraps=__import__("os").stat) as mock_stat:
+            self.assertFalse(is_block_device("/dev/null"))
+            mock_stat.assert_called_once()
+        self.assertFalse(is_block_device("/nonexistent/zram0"))
+        self.assertFalse(is_block_device("bad\x00path"))
+
+
+class TestIsDeviceActive(BaseTestCase):
+
+    @patch('core.device_management.prober.get_zram_mountpoint')
+    def test_swap_or_mount_means_active(self, mock_mount):
+        mock_mount.return_value = '[SWAP]'
+        self.assertTrue(prober.is_device_active('zram0'))
+        mock_mount.return_value = '/mnt/zram'
+        self.assertTrue(prober.is_device_active('zram0'))
+        mock_mount.return_value = ''
+        self.assertFalse(prober.is_device_active('zram0'))
+
+
+class TestApplyConfigBatch(BaseTestCase):
+
+    @patch('core.device_management.configurator.invalidate_config_cache')
+    @patch('core.device_management.configurator.pkexec_write', return_value=(True, None))
+    @patch('core.config_writer._read_local_config')
+    def test_invalid_device_reported_alone(self, mock_cfg, mock_write, mock_invalidate):
+        from configobj import ConfigObj
+        from core.device_management.configurator import apply_config_batch
+        mock_cfg.return_value = ConfigObj()
+
+        results = apply_config_batch({
+            'zram0': {'zram-size': '2G'},
+            'zram1': {'swap-priority': 'high'},
+        })
+
+        self.assertTrue(results['zram0'].success)
+        self.assertFalse(results['zram1'].success)
+        self.assertIn('zram1', results['zram1'].message)
+        rendered = mock_write.call_args[0][1]
+        self.assertIn('[zram0]', rendered)
+        self.assertNotIn('zram1', rendered)
+
+    @patch('core.device_management.configurator.pkexec_write')
+    @patch('core.config_writer._read_local_config')
+    def test_nothing_written_when_every_update_is_invalid(self, mock_cfg, mock_write):
+        from configobj import ConfigObj
+        from core.device_management.configurator import apply_config_batch
+        mock_cfg.return_value = ConfigObj()
+
+        results = apply_config_batch({'zram1': {'swap-priority': 'high'}}, apply_now=True)
+
+        self.assertFalse(results['zram1'].success)
+        mock_write.assert_not_called()
+
+    @patch('core.device_management.configurator.restart_unit_for_device')
+    @patch('core.device_management.configurator.pkexec_daemon_reload')
+    @patch('core.device_management.configurator.pkexec_write')
+    @patch('core.device_management.configurator.load_config_text')
+    @patch('core.config_writer._read_local_config')
+    def test_unchanged_render_skips_write_reload_and_restart(self, mock_cfg, mock_text, mock_write, mock_reload, mock_restart):
+        from configobj import ConfigObj
+        from core.device_management.configurator import apply_config_batch, apply_device_config
+        text = "[zram0]\nzram-size = 2G\n"
+        mock_cfg.side_effect = lambda: ConfigObj(text.splitlines(), list_values=False)
+        mock_text.return_value = text
+
+        result = apply_device_config('zram0', {'zram-size': '2G'}, restart_service=True)
+        results = apply_config_batch({'zram0': {'zram-size': '2G'}}, apply_now=True)
+
+        self.assertTrue(result.success)
+        self.assertIn('unchanged', result.message)
+        self.assertIn('unchanged', results['zram0'].message)
+        mock_write.assert_not_called()
+        mock_reload.assert_not_called()
+        mock_restart.assert_not_called()
+
+    @patch('core.device_management.configurator.invalidate_config_cache')
+    @patch('core.device_management.configurator.restart_unit_for_device', return_value=dm_types.UnitResult(True, "restarted"))
+    @patch('core.device_management.configurator.pkexec_daemon_reload', return_value=(True, None))
+    @patch('core.device_management.configurator.pkexec_write', return_value=(True, None))
+    @patch('core.device_management.configurator.load_config_text')
+    @patch('core.config_writer._read_local_config')
+    def test_batch_restarts_only_changed_sections(self, mock_cfg, mock_text, mock_write, mock_reload, mock_restart, mock_invalidate):
+        from configobj import ConfigObj
+        from core.device_management.configurator import apply_config_batch
+        text = "[zram0]\nzram-size = 2G\n\n[zram1]\nzram-size = 1G\n"
+        mock_cfg.side_effect = lambda: ConfigObj(text.splitlines(), list_values=False)
+        mock_text.return_value = text
+
+        results = apply_config_batch({
+            'zram0': {'zram-size': '2G'},
+            'zram1': {'zram-size': '4G'},
+        }, apply_now=True)
+
+        mock_write.assert_called_once()
+        mock_reload.assert_called_once()
+        mock_restart.assert_called_once_with('zram1')
+        self.assertIn('unchanged', results['zram0'].message)
+        self.assertTrue(results['zram1'].success)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 
 import threading
-from typing import Dict, List, Any, Set, Tuple
+from typing import Dict, List, Any, Set, Tuple, Optional
 from gi.repository import GLib
 
 import io
@@ -179,9 +179,8 @@ class ConfigureLogic:
         """
         # 1. Get Current Disk Content
         try:
-            with open(zram_config.get_active_config_path(), 'r') as f:
-                current_content = f.read()
-        except (FileNotFoundError, TypeError):
+            current_content = zram_config.load_config_text(zram_config.get_active_config_path())
+        except (OSError, TypeError):
             current_content = ""
             
         # 2. Get Preview Content
@@ -220,34 +219,29 @@ class ConfigureLogic:
         overall_success = True
         
         try:
+            # One read/write/daemon-reload for the whole batch instead of one per device
+            updates_by_device: Dict[str, Optional[Dict[str, Any]]] = {}
             for action, dev, desc in changes:
-                res = None
                 if action == "DELETE":
-                    # Pass apply_now=live_apply
-                    res = configurator.remove_device_config(dev, apply_now=live_apply)
-                    
-                else: # CREATE or MODIFY
-                    # Construct updates dict from snapshot
-                    cfg = device_configs_snapshot.get(dev)
-                    if not cfg:
-                        logs.append(f"Error: Missing config for {dev}")
-                        overall_success = False
-                        continue
-                        
-                    updates = ConfigureLogic._build_update_dict(cfg)
-                    
-                    # Pass reload_daemon=live_apply
-                    # If live_apply is True, we reload daemon and restart service
-                    res = configurator.apply_device_config(
-                        dev, 
-                        updates, 
-                        restart_service=live_apply, 
-                        reload_daemon=live_apply
-                    )
-                
-                logs.append(f"{dev}: {res.message}")
-                if not res.success:
+                    updates_by_device[dev] = None
+                    continue
+
+                # CREATE or MODIFY: construct updates dict from snapshot
+                cfg = device_configs_snapshot.get(dev)
+                if not cfg:
+                    logs.append(f"Error: Missing config for {dev}")
                     overall_success = False
+                    continue
+
+                updates_by_device[dev] = ConfigureLogic._build_update_dict(cfg)
+
+            if updates_by_device:
+                # If live_apply is True, we reload daemon and restart services
+                results = configurator.apply_config_batch(updates_by_device, apply_now=live_apply)
+                for dev, res in results.items():
+                    logs.append(f"{dev}: {res.message}")
+                    if not res.success:
+                        overall_success = False
             
         except Exception as e:
             overall_success = False
@@ -11,7 +11,6 @@ import subprocess
 
 from ui.custom_widgets import ScenarioCard
 from ui.device_picker import DevicePickerDialog
-from ui.global_config_dialog import GlobalConfigDialog
 import threading
 from core import config as zram_config
 from core.device_management import configurator
@@ -694,6 +693,7 @@ class ConfigurePage(Gtk.Box):
 
     def _on_global_settings_clicked(self, btn):
         """Open the Global Config Dialog."""
+        from ui.global_config_dialog import GlobalConfigDialog
         current = zram_config.read_global_config()
         dialog = GlobalConfigDialog(parent=self.get_root(), current_config=current)
         dialog.connect("applied", self._on_global_applied)
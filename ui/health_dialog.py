@@ -8,7 +8,6 @@ from gi.repository import Gtk, Adw, GLib
 
 from core import health
 from ui.health_button import HealthState
-from ui.log_viewer import LogViewerDialog
 
 class HealthReportDialog(Adw.Window):
     """
@@ -284,5 +283,6 @@ class HealthReportDialog(Adw.Window):
     
     def _on_view_logs_clicked(self, button):
         """Opens the Log Viewer dialog."""
+        from ui.log_viewer import LogViewerDialog
         dialog = LogViewerDialog(parent_window=self)
         dialog.present()
@@ -7,7 +7,7 @@ from core import config_writer
 from core.utils.io import _get_helper_path
 from core.utils.common import stream_command, SystemCommandError
 from core.device_management import configurator
-from core.config import CONFIG_PATH
+from core.config import CONFIG_PATH, invalidate_config_cache
 
 @dataclass
 class StepUpdate:
@@ -72,7 +72,11 @@ def _remove_device_generator(device_name: str) -> Generator[StepUpdate, None, No
             return
 
         # Stream the output. Steps are marked with ">> "
-        yield from _stream_subprocess(cmd, input_text=rendered)
+        try:
+            yield from _stream_subprocess(cmd, input_text=rendered)
+        finally:
+            # The helper rewrote CONFIG_PATH behind our back
+            invalidate_config_cache()
         yield StepUpdate("step_done", (True, "Removed"))
         
     except Exception as e:
@@ -111,7 +115,10 @@ def _apply_device_generator(device_name: str, ui_cfg: Dict[str, Any]) -> Generat
         helper = _get_helper_path()
         cmd = ["pkexec", helper, "live-apply", device_name, CONFIG_PATH]
         
-        yield from _stream_subprocess(cmd, input_text=rendered)
+        try:
+            yield from _stream_subprocess(cmd, input_text=rendered)
+        finally:
+            invalidate_config_cache()
         yield StepUpdate("step_done", (True, "Applied"))
 
     except Exception as e:
@@ -127,7 +134,10 @@ def _apply_device_generator(device_name: str, ui_cfg: Dict[str, Any]) -> Generat
             helper = _get_helper_path()
             # Reuse live-apply to restore the original content
             cmd_rollback = ["pkexec", helper, "live-apply", device_name, CONFIG_PATH]
-            yield from _stream_subprocess(cmd_rollback, input_text=original_config_content)
+            try:
+                yield from _stream_subprocess(cmd_rollback, input_text=original_config_content)
+            finally:
+                invalidate_config_cache()
             
             yield StepUpdate("log_line", "Rollback successful. System restored.")
             yield StepUpdate("step_done", (True, "Restored"))
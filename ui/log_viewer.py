@@ -9,6 +9,16 @@ from gi.repository import Gtk, Adw, Pango, Gdk
 from modules import journal
 from core.device_management import prober
 
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+def _format_timestamp(ts) -> str:
+    """'%b %d %H:%M:%S' without strftime's per-call format parse and locale lookup."""
+    try:
+        return f"{_MONTHS[ts.month - 1]} {ts.day:02d} {ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+    except (AttributeError, IndexError, TypeError):
+        return "--- -- --:--:--"
+
 class LogViewerDialog(Adw.Window):
     """
     A dialog that displays raw system logs with bash-like syntax highlighting.
@@ -88,11 +98,11 @@ class LogViewerDialog(Adw.Window):
         
         # If no devices, try fetching generic setup logs
         if not devices:
-             all_logs.extend(journal.list_zram_logs(unit="systemd-zram-setup@*.service", count=50))
+             all_logs.extend(journal.iter_zram_logs(unit="systemd-zram-setup@*.service", count=50))
         else:
             for device in devices:
                 unit = f"systemd-zram-setup@{device.name}.service"
-                all_logs.extend(journal.list_zram_logs(unit=unit, count=50))
+                all_logs.extend(journal.iter_zram_logs(unit=unit, count=50))
         
         # Sort by timestamp
         all_logs.sort(key=lambda r: r.timestamp)
@@ -107,8 +117,8 @@ class LogViewerDialog(Adw.Window):
             # Format: [TIMESTAMP] [LEVEL] MESSAGE
             
             # Timestamp
-            ts_str = record.timestamp.strftime("%b %d %H:%M:%S")
-            self._append_text(f"{ts_str} ", "timestamp")
+            ts_str = _format_timestamp(record.timestamp)
+            self._append_text(f"{ts_str} ", "timestamp", end_iter=iter_end)
             
             # Message Processing for Highlighting
             msg = record.message
@@ -126,18 +136,13 @@ class LogViewerDialog(Adw.Window):
             elif "Failed" in msg or "Error" in msg:
                 tags.append("error")
             
-            self._append_text(f"{msg}\n", *tags)
-            
-    def _append_text(self, text, *tags):
-        """Appends text with given tag names."""
-        start = self.buffer.get_end_iter()
-        self.buffer.insert(start, text)
-        if tags:
-            end = self.buffer.get_end_iter()
-            # Re-get start iter because insert invalidates it
-            start = self.buffer.get_iter_at_offset(end.get_offset() - len(text.encode('utf-8')))
-            # Actually len in chars is safer for GtkTextIter
-            start.backward_chars(len(text))
+            self._append_text(f"{msg}\n", *tags, end_iter=iter_end)
             
-            for tag_name in tags:
-                self.buffer.apply_tag_by_name(tag_name, start, end)
+    def _append_text(self, text, *tags, end_iter=None):
+        """
+        Appends text with given tag names in a single insert.
+        Pass a running end_iter to reuse it: GTK revalidates it past the new text.
+        """
+        if end_iter is None:
+            end_iter = self.buffer.get_end_iter()
+        self.buffer.insert_with_tags_by_name(end_iter, text, *tags)
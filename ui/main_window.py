@@ -12,8 +12,6 @@ from .status_page import StatusPage
 from .configure_page import ConfigurePage
 from .tune_page import TunePage
 from .hibernate_page import HibernatePage
-from .log_viewer import LogViewerDialog
-from .global_config_dialog import GlobalConfigDialog
 
 class MainWindow(Adw.ApplicationWindow):
     def __init__(self, *args, **kwargs):
@@ -171,12 +169,14 @@ class MainWindow(Adw.ApplicationWindow):
 
     def on_logs_clicked(self, btn):
         """Opens the Log Viewer dialog."""
+        from .log_viewer import LogViewerDialog
         dialog = LogViewerDialog(parent_window=self)
         dialog.present()
 
     def on_settings_clicked(self, btn):
         """Opens the Global Config dialog."""
         from core import config as zram_config
+        from .global_config_dialog import GlobalConfigDialog
         current = zram_config.read_global_config()
         dialog = GlobalConfigDialog(parent=self, current_config=current)
         dialog.connect("applied", self._on_global_applied)
@@ -156,9 +156,14 @@ def handle_action(action, payload):
                     success = False
                     errors.append(f"Failed to set CPU governor to {cpu_governor}")
                     
+            # One bootloader probe and drop-in read shared by both GRUB setters
+            boot_snapshot = None
+            if zswap_enabled is not None or psi_enabled is not None:
+                boot_snapshot = boot_config.snapshot_boot_config()
+
             # 3. Apply ZSwap GRUB configuration
             if zswap_enabled is not None:
-                res = boot_config.set_zswap_in_grub(zswap_enabled)
+                res = boot_config.set_zswap_in_grub(zswap_enabled, boot_snapshot)
                 if not res.success:
                     success = False
                     errors.append(res.message)
@@ -167,7 +172,7 @@ def handle_action(action, payload):
                     
             # 4. Apply PSI GRUB configuration
             if psi_enabled is not None:
-                res = boot_config.set_psi_in_grub(psi_enabled)
+                res = boot_config.set_psi_in_grub(psi_enabled, boot_snapshot)
                 if not res.success:
                     success = False
                     errors.append(res.message)
@@ -388,26 +393,23 @@ def handle_action(action, payload):
                 return {"status": "error", "message": res.message}
 
         elif action == "get_zram_config_raw":
-            from core.config import get_active_config_path
+            from core.config import get_active_config_path, load_config_text
             path = get_active_config_path()
-            content = ""
-            if path and path.exists():
-                try:
-                    content = path.read_text(encoding="utf-8")
-                except Exception as e:
-                    content = f"# Error reading config file: {e}"
-            else:
+            try:
+                content = load_config_text(path)
+            except FileNotFoundError:
                 content = "# No configuration file found at standard paths.\n# It will be created when you add a ZRAM device."
+            except Exception as e:
+                content = f"# Error reading config file: {e}"
             return {"status": "success", "content": content}
         
         elif action == "get_journal_logs":
             unit = payload.get("unit", "systemd-zram-setup@zram0.service")
             count = int(payload.get("count", 50))
-            from modules.journal import list_zram_logs
+            from modules.journal import iter_zram_logs
             try:
-                records = list_zram_logs(unit=unit, count=count)
                 logs_data = []
-                for r in records:
+                for r in iter_zram_logs(unit=unit, count=count):
                     logs_data.append({
                         "timestamp": r.timestamp.isoformat(),
                         "priority": r.priority,